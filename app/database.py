@@ -1,11 +1,133 @@
-from sqlalchemy import create_engine
+from dataclasses import dataclass
+from time import perf_counter
+
+from sqlalchemy import (
+    AsyncAdaptedQueuePool,
+    NullPool,
+    QueuePool,
+    create_engine,
+)
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
 
 from app.settings import Settings
 
-engine = create_engine(Settings().DATABASE_URL)
+
+@dataclass
+class PoolWaitStats:
+    """Time checkouts spend getting a connection, opening included."""
+
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+class _WaitTimingMixin:
+    """Record how long each checkout blocks on the pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = perf_counter()
+
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        finally:
+            self.wait_stats.record(perf_counter() - start)
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(_WaitTimingMixin, NullPool):
+    """A `NullPool` whose checkouts, each a new connection, are timed."""
+
+
+def engine_options(settings: Settings, poolclass: type) -> dict:
+    """Build the pool arguments for an engine from the settings.
+
+    `DATABASE_NULL_POOL` opens a connection per checkout instead, which
+    is what a transaction-mode PgBouncer in front of Postgres expects.
+    It also turns off psycopg's automatic prepared statements, since the
+    next transaction may run on a server connection that lacks them.
+    """
+    if settings.DATABASE_NULL_POOL:
+        return {
+            "poolclass": InstrumentedNullPool,
+            "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+            "connect_args": {"prepare_threshold": None},
+        }
+
+    return {
+        "poolclass": poolclass,
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": settings.DATABASE_POOL_PRE_PING,
+    }
+
+
+def pool_status(pool) -> dict:
+    """Report the connections held by `pool` and the time spent on it.
+
+    A pool that keeps no connections, such as `NullPool`, only reports
+    the time spent checking out, which is the time spent connecting.
+    """
+    wait_stats = getattr(pool, "wait_stats", PoolWaitStats())
+    status = {
+        "pool": type(pool).__name__,
+        "checkouts": wait_stats.checkouts,
+        "timeouts": wait_stats.timeouts,
+        "wait_seconds_total": wait_stats.wait_seconds_total,
+        "wait_seconds_max": wait_stats.wait_seconds_max,
+    }
+
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+
+    return status
+
+
+settings = Settings()
+
+engine = create_engine(
+    settings.DATABASE_URL,
+    **engine_options(settings, InstrumentedQueuePool),
+)
+async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    **engine_options(settings, InstrumentedAsyncQueuePool),
+)
 
 
 def get_session():  # pragma: no cover
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session():  # pragma: no cover
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
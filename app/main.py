@@ -1,22 +1,76 @@
 """FastAPI app."""
 
+from contextlib import asynccontextmanager
+from threading import Thread
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.database import async_engine, engine, settings
 from app.modules.auth.routers import router as auth_router
+from app.modules.essential_expense.async_routers import (
+    router as async_essential_expense_router,
+)
 from app.modules.essential_expense.routers import (
     router as essential_expense_router,
 )
+from app.modules.export.routers import router as export_router
+from app.modules.income.async_routers import router as async_income_router
 from app.modules.income.routers import router as income_router
+from app.modules.member.async_routers import router as async_member_router
 from app.modules.member.routers import router as member_router
+from app.modules.metrics.routers import router as metrics_router
+from app.modules.month.jobs import resume_rollovers
 from app.modules.month.routers import router as month_router
+from app.modules.non_essential_expense.async_routers import (
+    router as async_non_essential_expense_router,
+)
 from app.modules.non_essential_expense.routers import (
     router as non_essential_expense_router,
 )
+from app.modules.report.routers import router as report_router
+from app.modules.user.async_routers import router as async_user_router
 from app.modules.user.routers import router as user_router
+from app.settings import Settings
+from app.shared.instrumentation import (
+    InstrumentationMiddleware,
+    instrument_engine,
+    request_metrics,
+)
 from app.shared.schemas.utils import Message
+from app.shared.slow_queries import slow_query_log
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Resume the month rollovers a previous process left unfinished.
+
+    Opt in with `MONTH_ROLLOVER_RESUME`: it runs on the engine from
+    `DATABASE_URL`, not on whatever an overridden `get_session` serves.
+    """
+    if settings.MONTH_ROLLOVER_RESUME:
+        Thread(
+            target=resume_rollovers,
+            args=(engine, settings.MONTH_ROLLOVER_CHUNK_SIZE),
+            name="month-rollover-resume",
+            daemon=True,
+        ).start()
 
-app = FastAPI()
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
+
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+slow_query_log.watch(engine)
+slow_query_log.watch(async_engine.sync_engine, explain_engine=engine)
+
+app.add_middleware(
+    InstrumentationMiddleware,
+    metrics=request_metrics,
+    server_timing=settings.SERVER_TIMING_ENABLED,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +79,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# The async routers go first so their routes take precedence; routes
+# they do not define fall through to the sync routers below.
+if Settings().ASYNC_DATABASE:
+    app.include_router(async_user_router)
+    app.include_router(async_member_router)
+    app.include_router(async_income_router)
+    app.include_router(async_essential_expense_router)
+    app.include_router(async_non_essential_expense_router)
+
 app.include_router(user_router)
 app.include_router(auth_router)
 app.include_router(member_router)
@@ -32,6 +95,9 @@ app.include_router(month_router)
 app.include_router(income_router)
 app.include_router(essential_expense_router)
 app.include_router(non_essential_expense_router)
+app.include_router(export_router)
+app.include_router(metrics_router)
+app.include_router(report_router)
 
 
 @app.get("/", response_model=Message)
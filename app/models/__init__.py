@@ -7,6 +7,9 @@ from .month import Month
 from .month_essential_expense import MonthEssentialExpense
 from .month_income import MonthIncome
 from .month_non_essential_expense import MonthNonEssentialExpense
+from .month_rollover import MonthRollover
+from .monthly_rollup import MonthlyRollup
 from .non_essential_expense import NonEssentialExpense
 from .user import User
+from .user_data_version import UserDataVersion
 from .user_month import UserMonth
@@ -1,3 +1,11 @@
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import registry
 
 table_registry = registry()
+
+# The trigram indexes on `name` need the extension before the tables.
+event.listen(
+    table_registry.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
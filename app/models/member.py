@@ -17,7 +17,7 @@ class Member:
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     name: Mapped[str] = mapped_column(String(50))
-    id_user_fk: Mapped[int] = mapped_column(ForeignKey("user.id"))
+    id_user_fk: Mapped[int] = mapped_column(ForeignKey("user.id"), index=True)
     created_at: Mapped[datetime] = mapped_column(
         init=False, server_default=now()
     )
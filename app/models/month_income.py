@@ -1,6 +1,6 @@
 """Month Income model module."""
 
-from sqlalchemy import DECIMAL, ForeignKey
+from sqlalchemy import DECIMAL, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import table_registry
@@ -8,12 +8,30 @@ from app.models.base import table_registry
 
 @table_registry.mapped_as_dataclass
 class MonthIncome:
-    """Month Income model."""
+    """Month Income model.
+
+    A copy of the line as it was when the month rolled over, so editing
+    or deleting the line later leaves the month as it was.
+    """
 
     __tablename__ = "month_income"
+    __table_args__ = (
+        Index(
+            "ix_month_income_id_month_fk_id_user_fk",
+            "id_month_fk",
+            "id_user_fk",
+        ),
+    )
 
-    id_month_fk: Mapped[int] = mapped_column(ForeignKey("month.id"))
-    id_income_fk: Mapped[int] = mapped_column(
-        ForeignKey("income.id"), primary_key=True
+    id_month_fk: Mapped[int] = mapped_column(
+        ForeignKey("month.id"), primary_key=True
+    )
+    id_income_fk: Mapped[int] = mapped_column(primary_key=True)
+    id_user_fk: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE")
+    )
+    id_member_fk: Mapped[int | None] = mapped_column(
+        ForeignKey("member.id", ondelete="SET NULL"), index=True
     )
+    name: Mapped[str] = mapped_column(String(50))
     amount: Mapped[float] = mapped_column(DECIMAL(10, 2))
@@ -1,6 +1,6 @@
 """Month Non Essential Expense model module."""
 
-from sqlalchemy import DECIMAL, ForeignKey
+from sqlalchemy import DECIMAL, ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import table_registry
@@ -8,13 +8,31 @@ from app.models.base import table_registry
 
 @table_registry.mapped_as_dataclass
 class MonthNonEssentialExpense:
-    """Month Non Essential Expense model."""
+    """Month Non Essential Expense model.
+
+    A copy of the line as it was when the month rolled over, so editing
+    or deleting the line later leaves the month as it was.
+    """
 
     __tablename__ = "month_non_essential_expense"
+    __table_args__ = (
+        Index(
+            "ix_month_non_essential_expense_id_month_fk_id_user_fk",
+            "id_month_fk",
+            "id_user_fk",
+        ),
+    )
 
-    id_month_fk: Mapped[int] = mapped_column(ForeignKey("month.id"))
-    id_non_essential_expense_fk: Mapped[int] = mapped_column(
-        ForeignKey("non_essential_expense.id"), primary_key=True
+    id_month_fk: Mapped[int] = mapped_column(
+        ForeignKey("month.id"), primary_key=True
+    )
+    id_non_essential_expense_fk: Mapped[int] = mapped_column(primary_key=True)
+    id_user_fk: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE")
+    )
+    id_member_fk: Mapped[int | None] = mapped_column(
+        ForeignKey("member.id", ondelete="SET NULL"), index=True
     )
+    name: Mapped[str] = mapped_column(String(50))
     expected: Mapped[float] = mapped_column(DECIMAL(10, 2))
     paid: Mapped[float] = mapped_column(DECIMAL(10, 2))
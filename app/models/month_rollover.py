@@ -0,0 +1,34 @@
+"""Month Rollover model module."""
+
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.functions import now
+
+from app.models.base import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class MonthRollover:
+    """Progress of the background rollover of a month."""
+
+    __tablename__ = "month_rollover"
+
+    id_month_fk: Mapped[int] = mapped_column(
+        ForeignKey("month.id"), primary_key=True
+    )
+    total_users: Mapped[int] = mapped_column()
+    status: Mapped[str] = mapped_column(String(20), default="pending")
+    last_user_id: Mapped[int] = mapped_column(default=0)
+    processed_users: Mapped[int] = mapped_column(default=0)
+    inserted: Mapped[int] = mapped_column(default=0, server_default=text("0"))
+    skipped: Mapped[int] = mapped_column(default=0, server_default=text("0"))
+    error: Mapped[str | None] = mapped_column(default=None)
+    finished_at: Mapped[datetime | None] = mapped_column(default=None)
+    started_at: Mapped[datetime] = mapped_column(
+        init=False, server_default=now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        init=False, server_default=now(), onupdate=now()
+    )
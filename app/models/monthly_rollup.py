@@ -0,0 +1,39 @@
+"""Monthly Rollup model module."""
+
+from sqlalchemy import DECIMAL, ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class MonthlyRollup:
+    """Month line totals per user, month, category and member."""
+
+    __tablename__ = "monthly_rollup"
+    __table_args__ = (
+        Index(
+            "ix_monthly_rollup_group",
+            "id_user_fk",
+            "id_month_fk",
+            "category",
+            "id_member_fk",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("ix_monthly_rollup_id_user_fk_year", "id_user_fk", "year"),
+    )
+
+    id: Mapped[int] = mapped_column(init=False, primary_key=True)
+    id_user_fk: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE")
+    )
+    id_month_fk: Mapped[int] = mapped_column(
+        ForeignKey("month.id", ondelete="CASCADE")
+    )
+    year: Mapped[int] = mapped_column()
+    category: Mapped[str] = mapped_column(String(20))
+    id_member_fk: Mapped[int | None] = mapped_column()
+    amount: Mapped[float] = mapped_column(DECIMAL(12, 2), default=0)
+    expected: Mapped[float] = mapped_column(DECIMAL(12, 2), default=0)
+    paid: Mapped[float] = mapped_column(DECIMAL(12, 2), default=0)
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DECIMAL, ForeignKey, String
+from sqlalchemy import DECIMAL, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.functions import now
 
@@ -14,13 +14,29 @@ class NonEssentialExpense:
     """Non Essential Expense model."""
 
     __tablename__ = "non_essential_expense"
+    __table_args__ = (
+        Index(
+            "ix_non_essential_expense_id_user_fk_updated_at",
+            "id_user_fk",
+            text("updated_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_non_essential_expense_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(init=False, primary_key=True)
     id_user_fk: Mapped[int] = mapped_column(
         ForeignKey("user.id"), nullable=False
     )
     id_member_fk: Mapped[int] = mapped_column(
-        ForeignKey("member.id", ondelete="SET NULL"), nullable=True
+        ForeignKey("member.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
     )
     name: Mapped[str] = mapped_column(String(50))
     expected: Mapped[float] = mapped_column(DECIMAL(10, 2))
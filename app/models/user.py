@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import String
+from sqlalchemy import String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.functions import now
 
@@ -26,3 +26,6 @@ class User:
     updated_at: Mapped[datetime] = mapped_column(
         init=False, server_default=now(), onupdate=now()
     )
+    token_version: Mapped[int] = mapped_column(
+        init=False, default=0, server_default=text("0")
+    )
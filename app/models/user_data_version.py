@@ -0,0 +1,18 @@
+"""User Data Version model module."""
+
+from sqlalchemy import BigInteger, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import table_registry
+
+
+@table_registry.mapped_as_dataclass
+class UserDataVersion:
+    """Version of a user's members, incomes and expenses."""
+
+    __tablename__ = "user_data_version"
+
+    id_user_fk: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(BigInteger, default=0)
@@ -16,5 +16,5 @@ class UserMonth:
         ForeignKey("user.id"), primary_key=True
     )
     id_month_fk: Mapped[int] = mapped_column(
-        ForeignKey("month.id"), primary_key=True
+        ForeignKey("month.id"), primary_key=True, index=True
     )
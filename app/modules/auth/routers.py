@@ -2,6 +2,7 @@ from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -9,7 +10,12 @@ from sqlalchemy.orm import Session
 from app.database import get_session
 from app.models import User
 from app.modules.auth.schemas import Token
-from app.security import create_access_token, get_current_user, verify_password
+from app.security import (
+    create_access_token,
+    get_current_user,
+    invalidate_cached_user,
+    verify_and_update_password_async,
+)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -18,12 +24,18 @@ T_OAuth2Form = Annotated[OAuth2PasswordRequestForm, Depends()]
 
 
 @router.post("/token", response_model=Token)
-def login_for_access_token(
+async def login_for_access_token(
     session: T_Session,
     form_data: T_OAuth2Form,
 ):
-    user = session.scalar(
-        select(User).where(User.username == form_data.username)
+    """Check the password without holding a request thread meanwhile.
+
+    The sync session's work goes to the threadpool, and the hash is
+    awaited on the hashing executor.
+    """
+    user = await run_in_threadpool(
+        session.scalar,
+        select(User).where(User.username == form_data.username),
     )
 
     if not user:
@@ -32,13 +44,25 @@ def login_for_access_token(
             detail="Incorrect username or password",
         )
 
-    if not verify_password(form_data.password, user.password):
+    valid, updated_hash = await verify_and_update_password_async(
+        form_data.password, user.password
+    )
+
+    if not valid:
         raise HTTPException(
             status_code=HTTPStatus.BAD_REQUEST,
             detail="Incorrect username or password",
         )
 
-    access_token = create_access_token(data={"sub": user.username})
+    # Committing expires the user, and reloading it here would run on the
+    # event loop, so the token is made from what is already loaded.
+    username = user.username
+    access_token = create_access_token(data={"sub": username}, user=user)
+
+    if updated_hash:
+        user.password = updated_hash
+        await run_in_threadpool(session.commit)
+        invalidate_cached_user(username)
 
     return {"access_token": access_token, "token_type": "Bearer"}
 
@@ -47,6 +71,8 @@ def login_for_access_token(
 def refresh_token(
     user: User = Depends(get_current_user),
 ):
-    new_access_token = create_access_token(data={"sub": user.username})
+    new_access_token = create_access_token(
+        data={"sub": user.username}, user=user
+    )
 
     return {"access_token": new_access_token, "token_type": "Bearer"}
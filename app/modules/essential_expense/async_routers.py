@@ -0,0 +1,10 @@
+"""Essential Expense router for the async database mode."""
+
+from app.modules.essential_expense.resource import essential_expense
+from app.shared.ledger import ledger_async_router
+
+router = ledger_async_router(
+    essential_expense,
+    prefix="/essential-expenses",
+    tags=["essential expenses"],
+)
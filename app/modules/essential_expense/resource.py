@@ -0,0 +1,25 @@
+"""Essential Expense ledger resource."""
+
+from app.models.essential_expense import EssentialExpense
+from app.modules.essential_expense.schemas import (
+    EssentialExpenseBulkCreate,
+    EssentialExpenseBulkResult,
+    EssentialExpenseBulkUpdate,
+    EssentialExpenseCursorPaginated,
+    EssentialExpensePaginated,
+    EssentialExpensePublic,
+    EssentialExpenseSchema,
+)
+from app.shared.ledger import LedgerResource
+
+essential_expense = LedgerResource(
+    model=EssentialExpense,
+    label="essential expense",
+    schema=EssentialExpenseSchema,
+    public=EssentialExpensePublic,
+    paginated=EssentialExpensePaginated,
+    cursor_paginated=EssentialExpenseCursorPaginated,
+    bulk_create=EssentialExpenseBulkCreate,
+    bulk_update=EssentialExpenseBulkUpdate,
+    bulk_result=EssentialExpenseBulkResult,
+)
@@ -1,17 +1,25 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.modules.member.schemas import MemberPublic
+from app.shared.schemas.bulk import MAX_BULK_ITEMS, BulkError
 
 
 class Pagination(BaseModel):
     count: int
     page: int
     per_page: int
-    total: int
-    total_pages: int
+    total: Optional[int]
+    total_pages: Optional[int]
+
+
+class CursorPagination(BaseModel):
+    count: int
+    per_page: int
+    next_cursor: Optional[str]
+    total: Optional[int]
 
 
 class EssentialExpenseSchema(BaseModel):
@@ -37,5 +45,29 @@ class EssentialExpensePaginated(BaseModel):
     pagination: Pagination
 
 
+class EssentialExpenseCursorPaginated(BaseModel):
+    items: list[EssentialExpensePublic]
+    pagination: CursorPagination
+
+
+class EssentialExpenseBulkCreate(BaseModel):
+    items: list[EssentialExpenseSchema] = Field(max_length=MAX_BULK_ITEMS)
+
+
+class EssentialExpenseBulkUpdateItem(EssentialExpenseSchema):
+    id: int
+
+
+class EssentialExpenseBulkUpdate(BaseModel):
+    items: list[EssentialExpenseBulkUpdateItem] = Field(
+        max_length=MAX_BULK_ITEMS
+    )
+
+
+class EssentialExpenseBulkResult(BaseModel):
+    items: list[EssentialExpensePublic]
+    errors: list[BulkError]
+
+
 class EssentialExpenseList(BaseModel):
     essential_expenses: list[EssentialExpensePublic]
@@ -0,0 +1,152 @@
+"""Export router."""
+
+import csv
+import json
+from collections.abc import Iterator
+from io import StringIO
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Engine, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.database import get_session
+from app.models.essential_expense import EssentialExpense
+from app.models.income import Income
+from app.models.member import Member
+from app.models.non_essential_expense import NonEssentialExpense
+from app.modules.export.schemas import ExportFormat
+from app.security import TokenUser, get_token_user
+
+router = APIRouter(prefix="/exports", tags=["exports"])
+
+T_Session = Annotated[Session, Depends(get_session)]
+T_CurrentUser = Annotated[TokenUser, Depends(get_token_user)]
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = (
+    "kind",
+    "id",
+    "name",
+    "amount",
+    "id_member_fk",
+    "member_name",
+    "created_at",
+    "updated_at",
+)
+
+
+def _export_query(user_id: int):
+    """Select the user's incomes and expenses as one flat row set."""
+    branches = [
+        select(
+            literal(kind).label("kind"),
+            model.id,
+            model.name,
+            amount.label("amount"),
+            model.id_member_fk,
+            Member.name.label("member_name"),
+            model.created_at,
+            model.updated_at,
+        )
+        .outerjoin(Member, Member.id == model.id_member_fk)
+        .where(model.id_user_fk == user_id)
+        for kind, model, amount in (
+            ("income", Income, Income.amount),
+            ("essential_expense", EssentialExpense, EssentialExpense.expected),
+            (
+                "non_essential_expense",
+                NonEssentialExpense,
+                NonEssentialExpense.expected,
+            ),
+        )
+    ]
+
+    return union_all(*branches)
+
+
+def _encode_csv(rows) -> str:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(
+        (
+            row.kind,
+            row.id,
+            row.name,
+            row.amount,
+            row.id_member_fk,
+            row.member_name,
+            row.created_at.isoformat(),
+            row.updated_at.isoformat(),
+        )
+        for row in rows
+    )
+
+    return buffer.getvalue()
+
+
+def _encode_ndjson(rows) -> str:
+    return "".join(
+        json.dumps(
+            {
+                "kind": row.kind,
+                "id": row.id,
+                "name": row.name,
+                "amount": float(row.amount),
+                "id_member_fk": row.id_member_fk,
+                "member_name": row.member_name,
+                "created_at": row.created_at.isoformat(),
+                "updated_at": row.updated_at.isoformat(),
+            }
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def _stream_export(
+    bind: Engine, user_id: int, file_format: ExportFormat
+) -> Iterator[str]:
+    """Yield the export batch by batch from a server-side cursor.
+
+    The response is sent after the request session is closed, so the
+    stream runs on a session of its own.
+    """
+    encode = _encode_csv if file_format == ExportFormat.CSV else _encode_ndjson
+
+    with Session(bind) as session:
+        result = session.execute(
+            _export_query(user_id),
+            execution_options={"yield_per": EXPORT_BATCH_SIZE},
+        )
+
+        if file_format == ExportFormat.CSV:
+            yield ",".join(EXPORT_COLUMNS) + "\r\n"
+
+        for rows in result.partitions():
+            yield encode(rows)
+
+
+@router.get("/")
+def export_entries(
+    session: T_Session,
+    current_user: T_CurrentUser,
+    file_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+):
+    """Stream all the user's incomes and expenses as CSV or NDJSON."""
+    media_type = (
+        "text/csv"
+        if file_format == ExportFormat.CSV
+        else "application/x-ndjson"
+    )
+
+    return StreamingResponse(
+        _stream_export(session.get_bind(), current_user.id, file_format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="export.{file_format.value}"'
+            )
+        },
+    )
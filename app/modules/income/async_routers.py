@@ -0,0 +1,6 @@
+"""Income router for the async database mode."""
+
+from app.modules.income.resource import income
+from app.shared.ledger import ledger_async_router
+
+router = ledger_async_router(income, prefix="/incomes", tags=["incomes"])
@@ -0,0 +1,25 @@
+"""Income ledger resource."""
+
+from app.models.income import Income
+from app.modules.income.schemas import (
+    IncomeBulkCreate,
+    IncomeBulkResult,
+    IncomeBulkUpdate,
+    IncomeCursorPaginated,
+    IncomePaginated,
+    IncomePublic,
+    IncomeSchema,
+)
+from app.shared.ledger import LedgerResource
+
+income = LedgerResource(
+    model=Income,
+    label="income",
+    schema=IncomeSchema,
+    public=IncomePublic,
+    paginated=IncomePaginated,
+    cursor_paginated=IncomeCursorPaginated,
+    bulk_create=IncomeBulkCreate,
+    bulk_update=IncomeBulkUpdate,
+    bulk_result=IncomeBulkResult,
+)
@@ -1,17 +1,25 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.modules.member.schemas import MemberPublic
+from app.shared.schemas.bulk import MAX_BULK_ITEMS, BulkError
 
 
 class Pagination(BaseModel):
     count: int
     page: int
     per_page: int
-    total: int
-    total_pages: int
+    total: Optional[int]
+    total_pages: Optional[int]
+
+
+class CursorPagination(BaseModel):
+    count: int
+    per_page: int
+    next_cursor: Optional[str]
+    total: Optional[int]
 
 
 class IncomeSchema(BaseModel):
@@ -37,5 +45,27 @@ class IncomePaginated(BaseModel):
     pagination: Pagination
 
 
+class IncomeCursorPaginated(BaseModel):
+    items: list[IncomePublic]
+    pagination: CursorPagination
+
+
+class IncomeBulkCreate(BaseModel):
+    items: list[IncomeSchema] = Field(max_length=MAX_BULK_ITEMS)
+
+
+class IncomeBulkUpdateItem(IncomeSchema):
+    id: int
+
+
+class IncomeBulkUpdate(BaseModel):
+    items: list[IncomeBulkUpdateItem] = Field(max_length=MAX_BULK_ITEMS)
+
+
+class IncomeBulkResult(BaseModel):
+    items: list[IncomePublic]
+    errors: list[BulkError]
+
+
 class IncomeList(BaseModel):
     incomes: list[IncomePublic]
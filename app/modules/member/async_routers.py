@@ -0,0 +1,98 @@
+"""Member router for the async database mode.
+
+The handlers run the sync ones through `AsyncSession.run_sync`, so the
+queries are awaited on the event loop instead of a threadpool worker.
+"""
+
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_session
+from app.modules.member import routers
+from app.modules.member.schemas import MemberList, MemberPublic, MemberSchema
+from app.security import TokenUser, get_token_user_async
+from app.shared.etag import check_etag_async
+from app.shared.response_cache import CachingRoute, use_response_cache_async
+from app.shared.schemas.utils import Message
+
+router = APIRouter(
+    prefix="/members",
+    tags=["members"],
+    include_in_schema=False,
+    route_class=CachingRoute,
+)
+
+T_AsyncSession = Annotated[AsyncSession, Depends(get_async_session)]
+T_CurrentUser = Annotated[TokenUser, Depends(get_token_user_async)]
+
+
+@router.post("/", status_code=HTTPStatus.CREATED, response_model=MemberPublic)
+async def create_member(
+    member: MemberSchema,
+    session: T_AsyncSession,
+    current_user: T_CurrentUser,
+):
+    return await session.run_sync(
+        lambda sync_session: routers.create_member(
+            member, sync_session, current_user
+        )
+    )
+
+
+@router.get("/", response_model=MemberList)
+async def read_members(
+    session: T_AsyncSession,
+    limit: int = 10,
+    offset: int = 0,
+):
+    return await session.run_sync(
+        routers.read_members, limit=limit, offset=offset
+    )
+
+
+@router.get(
+    "/list",
+    response_model=MemberList,
+    dependencies=[
+        Depends(check_etag_async),
+        Depends(use_response_cache_async),
+    ],
+)
+async def read_members_list(
+    session: T_AsyncSession,
+    current_user: T_CurrentUser,
+    response: Response,
+):
+    return await session.run_sync(
+        routers.read_members_list,
+        current_user=current_user,
+        response=response,
+    )
+
+
+@router.put("/{member_id}", response_model=MemberPublic)
+async def update_member(
+    member_id: int,
+    member: MemberSchema,
+    session: T_AsyncSession,
+    current_user: T_CurrentUser,
+):
+    return await session.run_sync(
+        lambda sync_session: routers.update_member(
+            member_id, member, sync_session, current_user
+        )
+    )
+
+
+@router.delete("/{member_id}", response_model=Message)
+async def delete_member(
+    member_id: int, session: T_AsyncSession, current_user: T_CurrentUser
+):
+    return await session.run_sync(
+        lambda sync_session: routers.delete_member(
+            member_id, sync_session, current_user
+        )
+    )
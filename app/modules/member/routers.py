@@ -3,21 +3,27 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database import get_session
 from app.models.member import Member
-from app.models.user import User
 from app.modules.member.schemas import MemberList, MemberPublic, MemberSchema
-from app.security import get_current_user
+from app.modules.report.rollup import months_with_member, refresh_user_rollups
+from app.security import TokenUser, get_token_user
+from app.shared.etag import check_etag
+from app.shared.response_cache import CachingRoute, use_response_cache
+from app.shared.responses import model_response
 from app.shared.schemas.utils import Message
+from app.shared.versioning import bump_data_version
 
-router = APIRouter(prefix="/members", tags=["members"])
+router = APIRouter(
+    prefix="/members", tags=["members"], route_class=CachingRoute
+)
 
 T_Session = Annotated[Session, Depends(get_session)]
-T_CurrentUser = Annotated[User, Depends(get_current_user)]
+T_CurrentUser = Annotated[TokenUser, Depends(get_token_user)]
 
 
 @router.post("/", status_code=HTTPStatus.CREATED, response_model=MemberPublic)
@@ -32,6 +38,7 @@ def create_member(
     )
 
     session.add(db_member)
+    bump_data_version(session, current_user.id)
     session.commit()
     session.refresh(db_member)
 
@@ -44,18 +51,24 @@ def read_members(
     limit: int = 10,
     offset: int = 0,
 ):
-    members = session.scalars(select(Member).limit(limit).offset(offset))
+    members = session.scalars(select(Member).limit(limit).offset(offset)).all()
 
     return {"members": members}
 
 
-@router.get("/list", response_model=MemberList)
-def read_members_list(session: T_Session, current_user: T_CurrentUser):
+@router.get(
+    "/list",
+    response_model=MemberList,
+    dependencies=[Depends(check_etag), Depends(use_response_cache)],
+)
+def read_members_list(
+    session: T_Session, current_user: T_CurrentUser, response: Response
+):
     members = session.scalars(
         select(Member).where(Member.id_user_fk == current_user.id)
-    )
+    ).all()
 
-    return {"members": members}
+    return model_response(MemberList, response, {"members": members})
 
 
 @router.put("/{member_id}", response_model=MemberPublic)
@@ -82,6 +95,7 @@ def update_member(
     db_member.name = member.name
     db_member.id_user_fk = current_user.id
 
+    bump_data_version(session, current_user.id)
     session.commit()
     session.refresh(db_member)
 
@@ -106,7 +120,14 @@ def delete_member(
             detail="You don't have permission to delete this member",
         )
 
+    # The member's snapshots fall back to no member, so the rollups of
+    # those months are summed again once the delete is flushed.
+    month_ids = months_with_member(session, member_id)
+
     session.delete(db_member)
+    session.flush()
+    refresh_user_rollups(session, current_user.id, month_ids)
+    bump_data_version(session, current_user.id)
     session.commit()
 
     return {"message": "Member deleted successfully"}
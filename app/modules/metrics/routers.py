@@ -0,0 +1,68 @@
+"""Metrics router."""
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.database import async_engine, engine, pool_status
+from app.modules.metrics.schemas import (
+    CacheStats,
+    EnginePoolStatus,
+    HashingStats,
+    SlowQuery,
+)
+from app.security import hashing_executor, require_admin, user_cache
+from app.shared.instrumentation import request_metrics
+from app.shared.response_cache import response_cache
+from app.shared.slow_queries import slow_query_log
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("", response_class=PlainTextResponse)
+def read_request_metrics():
+    """Get the per-route latency and database cost in Prometheus format."""
+    return PlainTextResponse(
+        request_metrics.render(),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
+@router.get("/user-cache", response_model=CacheStats)
+def read_user_cache_stats():
+    """Get the size and hit/miss counters of the authenticated-user cache."""
+    return user_cache.stats()
+
+
+@router.get("/response-cache", response_model=CacheStats)
+def read_response_cache_stats():
+    """Get the size and hit/miss counters of the list response cache."""
+    return response_cache.stats()
+
+
+@router.get("/hashing", response_model=HashingStats)
+def read_hashing_stats():
+    """Get the load and queue depth of the password hashing executor."""
+    return hashing_executor.stats()
+
+
+@router.get("/pool", response_model=EnginePoolStatus)
+def read_pool_status():
+    """Get the connections held by the database pools and the wait times."""
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool),
+    }
+
+
+@router.get(
+    "/slow-queries",
+    response_model=list[SlowQuery],
+    dependencies=[Depends(require_admin)],
+)
+def read_slow_queries():
+    """Get the latest statements over the slow-query threshold.
+
+    Entries name users and plans show bound values, so it takes the
+    `X-Admin-Token` header.
+    """
+    return slow_query_log.entries()
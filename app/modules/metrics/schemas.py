@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class CacheStats(BaseModel):
+    size: int
+    maxsize: int
+    ttl: float
+    hits: int
+    misses: int
+    bytes: int
+    max_bytes: Optional[int]
+
+
+class HashingStats(BaseModel):
+    max_workers: int
+    max_queue: int
+    running: int
+    queue_depth: int
+    rejected: int
+
+
+class PoolStatus(BaseModel):
+    pool: str
+    size: Optional[int] = None
+    checked_out: Optional[int] = None
+    idle: Optional[int] = None
+    overflow: Optional[int] = None
+    checkouts: Optional[int] = None
+    timeouts: Optional[int] = None
+    wait_seconds_total: Optional[float] = None
+    wait_seconds_max: Optional[float] = None
+
+
+class EnginePoolStatus(BaseModel):
+    sync: PoolStatus
+    async_: PoolStatus = Field(alias="async")
+
+
+class SlowQuery(BaseModel):
+    at: datetime
+    duration_ms: float
+    statement: str
+    parameters: dict[str, str]
+    batch_size: int
+    route: Optional[str]
+    user_id: Optional[int]
+    plan: Optional[str]
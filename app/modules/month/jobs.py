@@ -0,0 +1,157 @@
+"""Background month rollover, run in user-id chunks."""
+
+import logging
+from datetime import timedelta
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import now
+
+from app.models.month_rollover import MonthRollover
+from app.models.user import User
+from app.modules.month.rollover import rollover_month
+from app.modules.report.rollup import refresh_rollup
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+def start_rollover(session: Session, month_id: int) -> MonthRollover:
+    """Queue the rollover of a month; the caller commits.
+
+    A month rolled over before starts again from its first user, which
+    only fills in what is missing.
+    """
+    total_users = session.scalar(select(func.count(User.id)))
+    job = session.get(MonthRollover, month_id)
+
+    if job is None:
+        job = MonthRollover(id_month_fk=month_id, total_users=total_users)
+        session.add(job)
+        return job
+
+    job.status = PENDING
+    job.total_users = total_users
+    job.last_user_id = 0
+    job.processed_users = 0
+    job.inserted = 0
+    job.skipped = 0
+    job.error = None
+    job.finished_at = None
+
+    return job
+
+
+def rollover_in_progress(
+    session: Session, month_id: int, stale_after: float
+) -> bool:
+    """Whether a runner is still working on the month's rollover.
+
+    Each chunk touches `updated_at`, so a job left pending or running by a
+    process that died stops counting after `stale_after` seconds and can
+    be started again.
+    """
+    return bool(
+        session.scalar(
+            select(func.count()).where(
+                MonthRollover.id_month_fk == month_id,
+                MonthRollover.status.in_([PENDING, RUNNING]),
+                MonthRollover.updated_at
+                > now() - timedelta(seconds=stale_after),
+            )
+        )
+    )
+
+
+def run_rollover_chunk(bind, month_id: int, chunk_size: int) -> bool:
+    """Roll the next `chunk_size` users over and commit.
+
+    The job row is locked for the chunk, so two runners on the same month
+    take turns instead of repeating work. Returns False once nothing is
+    left to do.
+    """
+    with Session(bind) as session:
+        job = session.scalar(
+            select(MonthRollover)
+            .where(MonthRollover.id_month_fk == month_id)
+            .with_for_update()
+        )
+
+        if job is None or job.status == DONE:
+            return False
+
+        chunk = (
+            select(User.id)
+            .where(User.id > job.last_user_id)
+            .order_by(User.id)
+            .limit(chunk_size)
+            .subquery()
+        )
+        users, last_user_id = session.execute(
+            select(func.count(), func.max(chunk.c.id))
+        ).one()
+
+        if not users:
+            job.status = DONE
+            job.finished_at = now()
+            session.commit()
+            return False
+
+        written = rollover_month(
+            session,
+            month_id,
+            after_user_id=job.last_user_id,
+            up_to_user_id=last_user_id,
+        )
+        refresh_rollup(
+            session,
+            month_id,
+            after_user_id=job.last_user_id,
+            up_to_user_id=last_user_id,
+        )
+
+        job.status = RUNNING
+        job.error = None
+        job.last_user_id = last_user_id
+        job.processed_users += users
+        job.inserted += sum(rows["inserted"] for rows in written.values())
+        job.skipped += sum(rows["skipped"] for rows in written.values())
+        session.commit()
+
+    return True
+
+
+def run_rollover(bind, month_id: int, chunk_size: int) -> None:
+    """Run a month's rollover to the end, resuming from its last chunk."""
+    try:
+        while run_rollover_chunk(bind, month_id, chunk_size):
+            pass
+    except Exception as exc:
+        logger.exception("Rollover of month %s failed", month_id)
+
+        with Session(bind) as session:
+            job = session.get(MonthRollover, month_id)
+            job.status = FAILED
+            job.error = str(exc)
+            session.commit()
+
+
+def resume_rollovers(bind, chunk_size: int) -> None:
+    """Finish the rollovers an earlier process left unfinished."""
+    try:
+        with Session(bind) as session:
+            month_ids = session.scalars(
+                select(MonthRollover.id_month_fk).where(
+                    MonthRollover.status != DONE
+                )
+            ).all()
+    except Exception:
+        logger.exception("Could not look up unfinished rollovers")
+        return
+
+    for month_id in month_ids:
+        run_rollover(bind, month_id, chunk_size)
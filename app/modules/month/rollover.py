@@ -0,0 +1,126 @@
+"""Month rollover: snapshot every user's templates into a month."""
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.essential_expense import EssentialExpense
+from app.models.income import Income
+from app.models.month_essential_expense import MonthEssentialExpense
+from app.models.month_income import MonthIncome
+from app.models.month_non_essential_expense import MonthNonEssentialExpense
+from app.models.non_essential_expense import NonEssentialExpense
+from app.models.user import User
+from app.models.user_month import UserMonth
+
+
+def user_id_range(
+    user_id, after_user_id: int, up_to_user_id: int | None = None
+):
+    """Filter `user_id` to the ids after `after_user_id`, up to the last."""
+    if up_to_user_id is None:
+        return user_id > after_user_id
+
+    return user_id.between(after_user_id + 1, up_to_user_id)
+
+
+def _copy(session: Session, model, columns: list[str], source) -> dict:
+    """Insert the `source` rows that are missing and count both kinds.
+
+    The source and the insert are CTEs of one statement, so the counts
+    describe exactly the rows that statement saw.
+    """
+    source = source.cte("source")
+    inserted = (
+        insert(model)
+        .from_select(columns, select(source))
+        .on_conflict_do_nothing()
+        .returning(literal(1))
+        .cte("inserted")
+    )
+    seen, written = session.execute(
+        select(
+            select(func.count()).select_from(source).scalar_subquery(),
+            select(func.count()).select_from(inserted).scalar_subquery(),
+        )
+    ).one()
+
+    return {"inserted": written, "skipped": seen - written}
+
+
+def rollover_month(
+    session: Session,
+    month_id: int,
+    after_user_id: int = 0,
+    up_to_user_id: int | None = None,
+) -> dict:
+    """Link every user to the month and snapshot their incomes and expenses.
+
+    Each table is filled with one `INSERT ... SELECT` run inside the
+    database, and rows that already exist are skipped, so running it
+    again only writes what is missing. The snapshots copy the line's
+    name, value, user and member, so they do not depend on the line
+    afterwards. `after_user_id` and `up_to_user_id` restrict it to a
+    range of user ids. Returns the rows inserted and skipped per table.
+    """
+    month = literal(month_id)
+
+    def in_range(user_id):
+        return user_id_range(user_id, after_user_id, up_to_user_id)
+
+    def lines(model, line_column: str, *values: str):
+        return (
+            [
+                "id_month_fk",
+                line_column,
+                "id_user_fk",
+                "id_member_fk",
+                "name",
+                *values,
+            ],
+            select(
+                month,
+                model.id,
+                model.id_user_fk,
+                model.id_member_fk,
+                model.name,
+            ).where(in_range(model.id_user_fk)),
+        )
+
+    income_columns, incomes = lines(Income, "id_income_fk", "amount")
+    essential_columns, essential = lines(
+        EssentialExpense, "id_essential_expense_fk", "expected", "paid"
+    )
+    non_essential_columns, non_essential = lines(
+        NonEssentialExpense, "id_non_essential_expense_fk", "expected", "paid"
+    )
+
+    copies = {
+        "user_months": (
+            UserMonth,
+            ["id_user_fk", "id_month_fk"],
+            select(User.id, month).where(in_range(User.id)),
+        ),
+        "incomes": (
+            MonthIncome,
+            income_columns,
+            incomes.add_columns(Income.amount),
+        ),
+        "essential_expenses": (
+            MonthEssentialExpense,
+            essential_columns,
+            essential.add_columns(EssentialExpense.expected, literal(0)),
+        ),
+        "non_essential_expenses": (
+            MonthNonEssentialExpense,
+            non_essential_columns,
+            non_essential.add_columns(
+                NonEssentialExpense.expected, literal(0)
+            ),
+        ),
+    }
+
+    return {
+        name: _copy(session, model, columns, source)
+        for name, (model, columns, source) in copies.items()
+    }
@@ -3,22 +3,45 @@
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.database import get_session
+from app.database import get_session, settings
 from app.models.month import Month
-from app.models.user import User
-from app.models.user_month import UserMonth
-from app.modules.month.schemas import MonthPublic, MonthSchema
+from app.models.month_rollover import MonthRollover
+from app.modules.month.jobs import (
+    rollover_in_progress,
+    run_rollover,
+    start_rollover,
+)
+from app.modules.month.schemas import (
+    MonthPublic,
+    MonthRolloverStatus,
+    MonthSchema,
+    MonthSummary,
+)
+from app.modules.month.summary import month_summary
+from app.security import TokenUser, get_token_user, require_admin
 
 router = APIRouter(prefix="/months", tags=["months"])
 
 T_Session = Annotated[Session, Depends(get_session)]
+T_CurrentUser = Annotated[TokenUser, Depends(get_token_user)]
 
 
-@router.post("/", status_code=HTTPStatus.CREATED, response_model=MonthPublic)
-def create_month(month: MonthSchema, session: T_Session):
+@router.post(
+    "/",
+    status_code=HTTPStatus.ACCEPTED,
+    response_model=MonthPublic,
+    dependencies=[Depends(require_admin)],
+)
+def create_month(
+    month: MonthSchema, session: T_Session, background_tasks: BackgroundTasks
+):
+    """Open a month and roll every user's lines over into it.
+
+    It covers every user, so it takes the `X-Admin-Token` header.
+    """
     db_month = Month(
         created_at=month.created_at,
     )
@@ -26,15 +49,81 @@ def create_month(month: MonthSchema, session: T_Session):
     session.add(db_month)
     session.flush()
 
-    users = session.query(User).all()
-
-    user_month_relations = [
-        UserMonth(id_user_fk=user.id, id_month_fk=db_month.id)
-        for user in users
-    ]
-    session.add_all(user_month_relations)
+    start_rollover(session, db_month.id)
 
     session.commit()
     session.refresh(db_month)
 
+    # The request session is closed before background tasks run.
+    background_tasks.add_task(
+        run_rollover,
+        session.get_bind(),
+        db_month.id,
+        settings.MONTH_ROLLOVER_CHUNK_SIZE,
+    )
+
     return db_month
+
+
+@router.get("/{month_id}/status", response_model=MonthRolloverStatus)
+def read_month_status(month_id: int, session: T_Session):
+    job = session.get(MonthRollover, month_id)
+
+    if not job:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Month not found"
+        )
+
+    return job
+
+
+@router.post(
+    "/{month_id}/rollover",
+    status_code=HTTPStatus.ACCEPTED,
+    response_model=MonthRolloverStatus,
+    dependencies=[Depends(require_admin)],
+)
+def rollover(
+    month_id: int, session: T_Session, background_tasks: BackgroundTasks
+):
+    """Run the month's rollover again as a background job.
+
+    It covers every user, so it takes the `X-Admin-Token` header.
+    """
+    if not session.get(Month, month_id):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Month not found"
+        )
+
+    if rollover_in_progress(
+        session, month_id, settings.MONTH_ROLLOVER_STALE_SECONDS
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail="Rollover already in progress",
+        )
+
+    job = start_rollover(session, month_id)
+    session.commit()
+    session.refresh(job)
+
+    background_tasks.add_task(
+        run_rollover,
+        session.get_bind(),
+        month_id,
+        settings.MONTH_ROLLOVER_CHUNK_SIZE,
+    )
+
+    return job
+
+
+@router.get("/{month_id}/summary", response_model=MonthSummary)
+def read_month_summary(
+    month_id: int, session: T_Session, current_user: T_CurrentUser
+):
+    if not session.get(Month, month_id):
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Month not found"
+        )
+
+    return month_summary(session, month_id, current_user.id)
@@ -1,7 +1,10 @@
 from datetime import datetime
+from typing import Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from app.modules.member.schemas import MemberPublic
+
 
 class MonthSchema(BaseModel):
     created_at: datetime
@@ -16,3 +19,36 @@ class MonthPublic(BaseModel):
 
 class MonthList(BaseModel):
     months: list[MonthPublic]
+
+
+class MonthRolloverStatus(BaseModel):
+    id_month_fk: int
+    status: str
+    total_users: int
+    processed_users: int
+    last_user_id: int
+    inserted: int
+    skipped: int
+    error: str | None
+    started_at: datetime
+    finished_at: datetime | None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MonthTotals(BaseModel):
+    income: float
+    essential_expected: float
+    essential_paid: float
+    non_essential_expected: float
+    non_essential_paid: float
+    balance: float
+
+
+class MonthMemberSummary(MonthTotals):
+    member: Optional[MemberPublic]
+
+
+class MonthSummary(MonthTotals):
+    id_month_fk: int
+    members: list[MonthMemberSummary]
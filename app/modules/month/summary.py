@@ -0,0 +1,112 @@
+"""Month summary: a user's snapshot totals, overall and per member."""
+
+from sqlalchemy import func, literal, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from app.models.member import Member
+from app.models.month_essential_expense import MonthEssentialExpense
+from app.models.month_income import MonthIncome
+from app.models.month_non_essential_expense import MonthNonEssentialExpense
+
+TOTALS = (
+    "income",
+    "essential_expected",
+    "essential_paid",
+    "non_essential_expected",
+    "non_essential_paid",
+)
+
+
+def _lines(month_id: int, user_id: int):
+    """Every snapshot line of the user in the month, one column per total."""
+    zero = literal(0)
+
+    return union_all(
+        select(
+            MonthIncome.id_member_fk.label("member_id"),
+            MonthIncome.amount.label("income"),
+            zero.label("essential_expected"),
+            zero.label("essential_paid"),
+            zero.label("non_essential_expected"),
+            zero.label("non_essential_paid"),
+        ).where(
+            MonthIncome.id_month_fk == month_id,
+            MonthIncome.id_user_fk == user_id,
+        ),
+        select(
+            MonthEssentialExpense.id_member_fk,
+            zero,
+            MonthEssentialExpense.expected,
+            MonthEssentialExpense.paid,
+            zero,
+            zero,
+        ).where(
+            MonthEssentialExpense.id_month_fk == month_id,
+            MonthEssentialExpense.id_user_fk == user_id,
+        ),
+        select(
+            MonthNonEssentialExpense.id_member_fk,
+            zero,
+            zero,
+            zero,
+            MonthNonEssentialExpense.expected,
+            MonthNonEssentialExpense.paid,
+        ).where(
+            MonthNonEssentialExpense.id_month_fk == month_id,
+            MonthNonEssentialExpense.id_user_fk == user_id,
+        ),
+    ).subquery()
+
+
+def _with_balance(row) -> dict:
+    totals = {name: float(getattr(row, name)) for name in TOTALS}
+    totals["balance"] = (
+        totals["income"]
+        - totals["essential_expected"]
+        - totals["non_essential_expected"]
+    )
+
+    return totals
+
+
+def month_summary(session: Session, month_id: int, user_id: int) -> dict:
+    """Sum the user's month lines with one grouped query.
+
+    `ROLLUP` returns a row per member plus the grand total row, told
+    apart by `GROUPING`. The balance is the income minus the expected
+    expenses.
+    """
+    lines = _lines(month_id, user_id)
+    member = tuple_(lines.c.member_id, Member.name)
+
+    rows = session.execute(
+        select(
+            func.grouping(lines.c.member_id).label("is_total"),
+            lines.c.member_id,
+            Member.name,
+            *(
+                func.coalesce(func.sum(lines.c[name]), 0).label(name)
+                for name in TOTALS
+            ),
+        )
+        .outerjoin(Member, Member.id == lines.c.member_id)
+        .group_by(func.rollup(member))
+        .order_by(lines.c.member_id)
+    )
+
+    summary = {"id_month_fk": month_id, "members": []}
+
+    for row in rows:
+        if row.is_total:
+            summary.update(_with_balance(row))
+            continue
+
+        member_summary = _with_balance(row)
+        member_summary["member"] = (
+            {"id": row.member_id, "name": row.name}
+            if row.member_id is not None
+            else None
+        )
+        summary["members"].append(member_summary)
+
+    return summary
@@ -0,0 +1,10 @@
+"""Non Essential Expense router for the async database mode."""
+
+from app.modules.non_essential_expense.resource import non_essential_expense
+from app.shared.ledger import ledger_async_router
+
+router = ledger_async_router(
+    non_essential_expense,
+    prefix="/non-essential-expenses",
+    tags=["non essential expenses"],
+)
@@ -0,0 +1,25 @@
+"""Non Essential Expense ledger resource."""
+
+from app.models.non_essential_expense import NonEssentialExpense
+from app.modules.non_essential_expense.schemas import (
+    NonEssentialExpenseBulkCreate,
+    NonEssentialExpenseBulkResult,
+    NonEssentialExpenseBulkUpdate,
+    NonEssentialExpenseCursorPaginated,
+    NonEssentialExpensePaginated,
+    NonEssentialExpensePublic,
+    NonEssentialExpenseSchema,
+)
+from app.shared.ledger import LedgerResource
+
+non_essential_expense = LedgerResource(
+    model=NonEssentialExpense,
+    label="non essential expense",
+    schema=NonEssentialExpenseSchema,
+    public=NonEssentialExpensePublic,
+    paginated=NonEssentialExpensePaginated,
+    cursor_paginated=NonEssentialExpenseCursorPaginated,
+    bulk_create=NonEssentialExpenseBulkCreate,
+    bulk_update=NonEssentialExpenseBulkUpdate,
+    bulk_result=NonEssentialExpenseBulkResult,
+)
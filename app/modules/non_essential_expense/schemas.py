@@ -1,17 +1,25 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.modules.member.schemas import MemberPublic
+from app.shared.schemas.bulk import MAX_BULK_ITEMS, BulkError
 
 
 class Pagination(BaseModel):
     count: int
     page: int
     per_page: int
-    total: int
-    total_pages: int
+    total: Optional[int]
+    total_pages: Optional[int]
+
+
+class CursorPagination(BaseModel):
+    count: int
+    per_page: int
+    next_cursor: Optional[str]
+    total: Optional[int]
 
 
 class NonEssentialExpenseSchema(BaseModel):
@@ -37,5 +45,29 @@ class NonEssentialExpensePaginated(BaseModel):
     pagination: Pagination
 
 
+class NonEssentialExpenseCursorPaginated(BaseModel):
+    items: list[NonEssentialExpensePublic]
+    pagination: CursorPagination
+
+
+class NonEssentialExpenseBulkCreate(BaseModel):
+    items: list[NonEssentialExpenseSchema] = Field(max_length=MAX_BULK_ITEMS)
+
+
+class NonEssentialExpenseBulkUpdateItem(NonEssentialExpenseSchema):
+    id: int
+
+
+class NonEssentialExpenseBulkUpdate(BaseModel):
+    items: list[NonEssentialExpenseBulkUpdateItem] = Field(
+        max_length=MAX_BULK_ITEMS
+    )
+
+
+class NonEssentialExpenseBulkResult(BaseModel):
+    items: list[NonEssentialExpensePublic]
+    errors: list[BulkError]
+
+
 class NonEssentialExpenseList(BaseModel):
     non_essential_expenses: list[NonEssentialExpensePublic]
@@ -0,0 +1,145 @@
+"""Incremental refresh of the monthly rollup table."""
+
+from sqlalchemy import delete, extract, func, literal, select, union, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.month import Month
+from app.models.month_essential_expense import MonthEssentialExpense
+from app.models.month_income import MonthIncome
+from app.models.month_non_essential_expense import MonthNonEssentialExpense
+from app.models.monthly_rollup import MonthlyRollup
+from app.modules.month.rollover import user_id_range
+
+INCOME = "income"
+ESSENTIAL = "essential"
+NON_ESSENTIAL = "non_essential"
+
+
+def _month_lines(month_id: int, in_range):
+    """The month's snapshot lines of the users `in_range` picks."""
+    zero = literal(0)
+
+    return union_all(
+        select(
+            MonthIncome.id_user_fk.label("id_user_fk"),
+            literal(INCOME).label("category"),
+            MonthIncome.id_member_fk.label("id_member_fk"),
+            MonthIncome.amount.label("amount"),
+            zero.label("expected"),
+            zero.label("paid"),
+        ).where(
+            MonthIncome.id_month_fk == month_id,
+            in_range(MonthIncome.id_user_fk),
+        ),
+        select(
+            MonthEssentialExpense.id_user_fk,
+            literal(ESSENTIAL),
+            MonthEssentialExpense.id_member_fk,
+            zero,
+            MonthEssentialExpense.expected,
+            MonthEssentialExpense.paid,
+        ).where(
+            MonthEssentialExpense.id_month_fk == month_id,
+            in_range(MonthEssentialExpense.id_user_fk),
+        ),
+        select(
+            MonthNonEssentialExpense.id_user_fk,
+            literal(NON_ESSENTIAL),
+            MonthNonEssentialExpense.id_member_fk,
+            zero,
+            MonthNonEssentialExpense.expected,
+            MonthNonEssentialExpense.paid,
+        ).where(
+            MonthNonEssentialExpense.id_month_fk == month_id,
+            in_range(MonthNonEssentialExpense.id_user_fk),
+        ),
+    ).subquery()
+
+
+def refresh_rollup(
+    session: Session,
+    month_id: int,
+    after_user_id: int = 0,
+    up_to_user_id: int | None = None,
+) -> int:
+    """Recompute the rollup rows of one month for a range of user ids.
+
+    Only the (user, month) groups in the range are deleted and summed
+    again from the month lines, so a change costs as much as the lines
+    it touches rather than the whole history. Call it after writing
+    month lines; the caller commits. Returns the rows written.
+    """
+
+    def in_range(user_id):
+        return user_id_range(user_id, after_user_id, up_to_user_id)
+
+    year = session.scalar(
+        select(extract("year", Month.created_at)).where(Month.id == month_id)
+    )
+    lines = _month_lines(month_id, in_range)
+
+    session.execute(
+        delete(MonthlyRollup)
+        .where(
+            MonthlyRollup.id_month_fk == month_id,
+            in_range(MonthlyRollup.id_user_fk),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+    return session.execute(
+        insert(MonthlyRollup).from_select(
+            [
+                "id_user_fk",
+                "id_month_fk",
+                "year",
+                "category",
+                "id_member_fk",
+                "amount",
+                "expected",
+                "paid",
+            ],
+            select(
+                lines.c.id_user_fk,
+                literal(month_id),
+                literal(int(year)),
+                lines.c.category,
+                lines.c.id_member_fk,
+                func.sum(lines.c.amount),
+                func.sum(lines.c.expected),
+                func.sum(lines.c.paid),
+            ).group_by(
+                lines.c.id_user_fk, lines.c.category, lines.c.id_member_fk
+            ),
+        ),
+        execution_options={"preserve_rowcount": True},
+    ).rowcount
+
+
+def months_with_member(session: Session, member_id: int) -> list[int]:
+    """The months whose snapshots attribute a line to `member_id`."""
+    return session.scalars(
+        union(
+            *(
+                select(model.id_month_fk).where(
+                    model.id_member_fk == member_id
+                )
+                for model in (
+                    MonthIncome,
+                    MonthEssentialExpense,
+                    MonthNonEssentialExpense,
+                )
+            )
+        )
+    ).all()
+
+
+def refresh_user_rollups(
+    session: Session, user_id: int, month_ids: list[int]
+) -> None:
+    """Recompute one user's rollup rows of `month_ids`; the caller commits."""
+    for month_id in month_ids:
+        refresh_rollup(
+            session, month_id, after_user_id=user_id - 1, up_to_user_id=user_id
+        )
@@ -0,0 +1,70 @@
+"""Report router."""
+
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.database import get_session
+from app.models.monthly_rollup import MonthlyRollup
+from app.modules.report.rollup import ESSENTIAL, INCOME, NON_ESSENTIAL
+from app.modules.report.schemas import YearlyReport
+from app.security import TokenUser, get_token_user
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+T_Session = Annotated[Session, Depends(get_session)]
+T_CurrentUser = Annotated[TokenUser, Depends(get_token_user)]
+
+
+def _sum(column, category: str):
+    return func.coalesce(
+        func.sum(column).filter(MonthlyRollup.category == category), 0
+    )
+
+
+@router.get("/yearly", response_model=YearlyReport)
+def read_yearly_report(
+    session: T_Session,
+    current_user: T_CurrentUser,
+    from_year: Optional[int] = None,
+    to_year: Optional[int] = None,
+):
+    query = (
+        select(
+            MonthlyRollup.year,
+            _sum(MonthlyRollup.amount, INCOME).label("income"),
+            _sum(MonthlyRollup.expected, ESSENTIAL).label(
+                "essential_expected"
+            ),
+            _sum(MonthlyRollup.paid, ESSENTIAL).label("essential_paid"),
+            _sum(MonthlyRollup.expected, NON_ESSENTIAL).label(
+                "non_essential_expected"
+            ),
+            _sum(MonthlyRollup.paid, NON_ESSENTIAL).label(
+                "non_essential_paid"
+            ),
+        )
+        .where(MonthlyRollup.id_user_fk == current_user.id)
+        .group_by(MonthlyRollup.year)
+        .order_by(MonthlyRollup.year)
+    )
+
+    if from_year is not None:
+        query = query.where(MonthlyRollup.year >= from_year)
+
+    if to_year is not None:
+        query = query.where(MonthlyRollup.year <= to_year)
+
+    years = [
+        {
+            **row._asdict(),
+            "balance": row.income
+            - row.essential_expected
+            - row.non_essential_expected,
+        }
+        for row in session.execute(query)
+    ]
+
+    return {"years": years}
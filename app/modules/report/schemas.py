@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class YearTotals(BaseModel):
+    year: int
+    income: float
+    essential_expected: float
+    essential_paid: float
+    non_essential_expected: float
+    non_essential_paid: float
+    balance: float
+
+
+class YearlyReport(BaseModel):
+    years: list[YearTotals]
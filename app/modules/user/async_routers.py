@@ -0,0 +1,121 @@
+"""Users routes for the async database mode."""
+
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_async_session
+from app.models import User
+from app.modules.user.schemas import UserList, UserPublic, UserSchema
+from app.security import (
+    get_current_user_async,
+    get_password_hash_async,
+    invalidate_cached_user,
+    revoke_tokens,
+)
+from app.shared.schemas.utils import Message
+
+router = APIRouter(prefix="/users", tags=["users"], include_in_schema=False)
+
+T_AsyncSession = Annotated[AsyncSession, Depends(get_async_session)]
+T_CurrentUser = Annotated[User, Depends(get_current_user_async)]
+
+
+@router.post("/", status_code=HTTPStatus.CREATED, response_model=UserPublic)
+async def create_user(
+    user: UserSchema,
+    session: T_AsyncSession,
+):
+    db_user = await session.scalar(
+        select(User).where(
+            (User.username == user.username) | (User.email == user.email)
+        )
+    )
+
+    if db_user:
+        if db_user.username == user.username:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail="Username already registered",
+            )
+        elif db_user.email == user.email:
+            raise HTTPException(
+                status_code=HTTPStatus.BAD_REQUEST,
+                detail="Email already registered",
+            )
+
+    db_user = User(
+        name=user.name,
+        username=user.username,
+        email=user.email,
+        password=await get_password_hash_async(user.password),
+    )
+
+    session.add(db_user)
+    await session.commit()
+    await session.refresh(db_user)
+
+    return db_user
+
+
+@router.get("/", response_model=UserList)
+async def read_users(
+    session: T_AsyncSession, limit: int = 10, offset: int = 0
+):
+    users = await session.scalars(select(User).limit(limit).offset(offset))
+    return {"users": users.all()}
+
+
+@router.put("/{user_id}", response_model=UserPublic)
+async def update_user(
+    user_id: int,
+    user: UserSchema,
+    session: T_AsyncSession,
+    current_user: T_CurrentUser,
+):
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Not enough permissions",
+        )
+
+    username = current_user.username
+
+    current_user.name = user.name
+    current_user.username = user.username
+    current_user.email = user.email
+    current_user.password = await get_password_hash_async(user.password)
+
+    revoke_tokens(current_user)
+
+    await session.commit()
+    await session.refresh(current_user)
+
+    invalidate_cached_user(username, current_user.id)
+
+    return current_user
+
+
+@router.delete("/{user_id}", response_model=Message)
+async def delete_user(
+    user_id: int,
+    session: T_AsyncSession,
+    current_user: T_CurrentUser,
+):
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Not enough permissions",
+        )
+
+    username = current_user.username
+
+    await session.delete(current_user)
+    await session.commit()
+
+    invalidate_cached_user(username, user_id)
+
+    return {"message": "User deleted"}
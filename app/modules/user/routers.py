@@ -4,13 +4,24 @@ from http import HTTPStatus
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database import get_session
 from app.models import User
-from app.modules.user.schemas import UserList, UserPublic, UserSchema
-from app.security import get_current_user, get_password_hash
+from app.modules.user.schemas import (
+    UserList,
+    UserPublic,
+    UserSchema,
+    UserUpdateSchema,
+)
+from app.security import (
+    get_current_user,
+    get_password_hash_async,
+    invalidate_cached_user,
+    revoke_tokens,
+)
 from app.shared.schemas.utils import Message
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -20,14 +31,21 @@ T_CurrentUser = Annotated[User, Depends(get_current_user)]
 
 
 @router.post("/", status_code=HTTPStatus.CREATED, response_model=UserPublic)
-def create_user(
+async def create_user(
     user: UserSchema,
     session: T_Session,
 ):
-    db_user = session.scalar(
+    """Create a user, awaiting the hash rather than blocking a thread.
+
+    The handlers that hash are async so a queue of hashes does not tie up
+    the threadpool the sync routes run on; their session work goes to it
+    through `run_in_threadpool`.
+    """
+    db_user = await run_in_threadpool(
+        session.scalar,
         select(User).where(
             (User.username == user.username) | (User.email == user.email)
-        )
+        ),
     )
 
     if db_user:
@@ -46,12 +64,13 @@ def create_user(
         name=user.name,
         username=user.username,
         email=user.email,
-        password=get_password_hash(user.password),
+        password=await get_password_hash_async(user.password),
     )
 
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)  # Refresh the object to get the id
+    await run_in_threadpool(session.commit)
+    # Refresh the object to get the id
+    await run_in_threadpool(session.refresh, db_user)
 
     return db_user
 
@@ -63,7 +82,7 @@ def read_users(session: T_Session, limit: int = 10, offset: int = 0):
 
 
 @router.put("/{user_id}", response_model=UserPublic)
-def update_user(
+async def update_user(
     user_id: int,
     user: UserSchema,
     session: T_Session,
@@ -75,13 +94,55 @@ def update_user(
             detail="Not enough permissions",
         )
 
+    username = current_user.username
+
     current_user.name = user.name
     current_user.username = user.username
     current_user.email = user.email
-    current_user.password = get_password_hash(user.password)
+    current_user.password = await get_password_hash_async(user.password)
 
-    session.commit()
-    session.refresh(current_user)
+    revoke_tokens(current_user)
+
+    await run_in_threadpool(session.commit)
+    await run_in_threadpool(session.refresh, current_user)
+
+    invalidate_cached_user(username, current_user.id)
+
+    return current_user
+
+
+@router.patch("/{user_id}", response_model=UserPublic)
+async def partial_update_user(
+    user_id: int,
+    user: UserUpdateSchema,
+    session: T_Session,
+    current_user: T_CurrentUser,
+):
+    """Update the given fields, hashing the password only when sent."""
+    if current_user.id != user_id:
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Not enough permissions",
+        )
+
+    username = current_user.username
+    changes = user.model_dump(exclude_unset=True, exclude_none=True)
+
+    if "password" in changes:
+        changes["password"] = await get_password_hash_async(
+            changes["password"]
+        )
+
+    for field, value in changes.items():
+        setattr(current_user, field, value)
+
+    if changes.keys() & {"username", "password"}:
+        revoke_tokens(current_user)
+
+    await run_in_threadpool(session.commit)
+    await run_in_threadpool(session.refresh, current_user)
+
+    invalidate_cached_user(username, current_user.id)
 
     return current_user
 
@@ -98,7 +159,11 @@ def delete_user(
             detail="Not enough permissions",
         )
 
+    username = current_user.username
+
     session.delete(current_user)
     session.commit()
 
+    invalidate_cached_user(username, user_id)
+
     return {"message": "User deleted"}
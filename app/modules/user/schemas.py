@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, ConfigDict, EmailStr
 
 
@@ -8,6 +10,13 @@ class UserSchema(BaseModel):
     password: str
 
 
+class UserUpdateSchema(BaseModel):
+    name: Optional[str] = None
+    username: Optional[str] = None
+    email: Optional[EmailStr] = None
+    password: Optional[str] = None
+
+
 class UserPublic(BaseModel):
     id: int
     name: str
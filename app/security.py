@@ -1,72 +1,352 @@
+from asyncio import wrap_future
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from http import HTTPStatus
+from itertools import count
+from secrets import compare_digest
+from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends, Header, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jwt import decode, encode
-from jwt.exceptions import ExpiredSignatureError, PyJWTError
+from jwt.exceptions import PyJWTError
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
-from app.database import get_session
+from app.database import get_async_session, get_session
 from app.models import User
 from app.settings import Settings
+from app.shared.cache import CacheBackend, LocalCache
+from app.shared.hashing import HashingExecutor
+from app.shared.instrumentation import note_request_user
 
-pwd_context = PasswordHash.recommended()
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 settings = Settings()
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
+
+
+def build_password_hash(
+    time_cost: int, memory_cost: int, parallelism: int
+) -> PasswordHash:
+    return PasswordHash(
+        (
+            Argon2Hasher(
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+            ),
+        )
+    )
+
+
+pwd_context = build_password_hash(
+    settings.PASSWORD_HASH_TIME_COST,
+    settings.PASSWORD_HASH_MEMORY_COST,
+    settings.PASSWORD_HASH_PARALLELISM,
+)
+hashing_executor = HashingExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+# Resolved users by token subject, `iat` and the subject's generation,
+# so every live token of a user has its own entry. Invalidating drops
+# the generation; the next lookup draws a fresh one from
+# `_generations`, which leaves the older entries unreachable.
+user_cache: CacheBackend = LocalCache(
+    maxsize=settings.USER_CACHE_MAXSIZE, ttl=settings.USER_CACHE_TTL
+)
+user_generations: CacheBackend = LocalCache(
+    maxsize=settings.USER_CACHE_MAXSIZE, ttl=settings.USER_CACHE_TTL
+)
+_generations = count(1)
+
+# Current token version by user id, -1 once the user is gone. Tokens
+# carrying an older version are revoked. Entries are dropped when this
+# process revokes, and other processes see it within the TTL.
+token_versions: CacheBackend = LocalCache(
+    maxsize=settings.USER_CACHE_MAXSIZE,
+    ttl=settings.TOKEN_VERSION_CACHE_TTL,
+)
+
+
+@dataclass(frozen=True)
+class TokenUser:
+    """The user a request is authorized for, as its token tells."""
+
+    id: int
+    username: str
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return hashing_executor.submit(pwd_context.hash, password).result()
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await wrap_future(
+        hashing_executor.submit(pwd_context.hash, password)
+    )
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return hashing_executor.submit(
+        pwd_context.verify, plain_password, hashed_password
+    ).result()
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify the password and rehash it if its parameters are outdated."""
+    return hashing_executor.submit(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    ).result()
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return await wrap_future(
+        hashing_executor.submit(
+            pwd_context.verify_and_update, plain_password, hashed_password
+        )
+    )
 
 
-def create_access_token(data: dict):
+def user_claims(user_id: int, token_version: int) -> dict:
+    """Claims that let `get_token_user` authorize without the user row."""
+    return {"uid": user_id, "ver": token_version}
+
+
+def create_access_token(data: dict, user: User | None = None):
+    """Sign `data` into a token, with `user`'s id and version if given."""
     to_encode = data.copy()
-    expire = datetime.now(tz=ZoneInfo("UTC")) + timedelta(
+
+    if user is not None:
+        to_encode.update(user_claims(user.id, user.token_version))
+
+    issued_at = datetime.now(tz=ZoneInfo("UTC"))
+    expire = issued_at + timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": issued_at})
     encoded_jwt = encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
 
 
-def get_current_user(
-    session: Session = Depends(get_session),
-    token: str = Depends(oauth2_scheme),
-):
-    credentials_exception = HTTPException(
+def _detached_copy(user: User) -> User:
+    """Copy the loaded columns of `user` into a session-less instance."""
+    copy = User(
+        name=user.name,
+        username=user.username,
+        email=user.email,
+        password=user.password,
+    )
+    copy.id = user.id
+    copy.created_at = user.created_at
+    copy.updated_at = user.updated_at
+    copy.token_version = user.token_version
+
+    make_transient_to_detached(copy)
+
+    return copy
+
+
+def invalidate_cached_user(username: str, user_id: int | None = None):
+    """Forget the cached user resolved for `username` tokens.
+
+    With `user_id`, its token version is read again too, so a revocation
+    or deletion just committed applies to the next request.
+    """
+    user_generations.delete(username)
+
+    if user_id is not None:
+        token_versions.delete(user_id)
+
+
+def revoke_tokens(user: User) -> None:
+    """Revoke every token issued to `user` so far, once committed.
+
+    The version is bumped in the UPDATE itself, so two revocations racing
+    each other both count; the attribute is expired once flushed.
+    """
+    user.token_version = User.token_version + 1
+    token_versions.delete(user.id)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=HTTPStatus.UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _decode(token: str) -> dict:
+    """Validate `token` and return its claims, which name a subject."""
     try:
         payload = decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        username: str = payload.get("sub")
+    except PyJWTError:
+        raise _credentials_exception()
 
-        if not username:
-            raise credentials_exception
+    if not payload.get("sub"):
+        raise _credentials_exception()
 
-    except ExpiredSignatureError:
-        raise credentials_exception
+    return payload
 
-    except PyJWTError:
-        raise credentials_exception
+
+def _check_version(payload: dict, version: int) -> None:
+    if "ver" in payload and payload["ver"] != version:
+        raise _credentials_exception()
+
+
+def _user_cache_key(username: str, issued_at: int | None) -> tuple:
+    generation = user_generations.get(username)
+
+    if generation is None:
+        generation = next(_generations)
+        user_generations.set(username, generation)
+
+    return username, issued_at, generation
+
+
+def get_current_user(
+    session: Session = Depends(get_session),
+    token: str = Depends(oauth2_scheme),
+):
+    payload = _decode(token)
+    username, issued_at = payload["sub"], payload.get("iat")
+
+    cache_key = _user_cache_key(username, issued_at)
+    cached_user = user_cache.get(cache_key)
+
+    if cached_user:
+        _check_version(payload, cached_user.token_version)
+        note_request_user(cached_user.id)
+        return session.merge(cached_user, load=False)
 
     user_db = session.scalar(select(User).where(User.username == username))
 
     if not user_db:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    _check_version(payload, user_db.token_version)
+    user_cache.set(cache_key, _detached_copy(user_db))
+    token_versions.set(user_db.id, user_db.token_version)
+    note_request_user(user_db.id)
 
     return user_db
+
+
+async def get_current_user_async(
+    session: AsyncSession = Depends(get_async_session),
+    token: str = Depends(oauth2_scheme),
+):
+    payload = _decode(token)
+    username, issued_at = payload["sub"], payload.get("iat")
+
+    cache_key = _user_cache_key(username, issued_at)
+    cached_user = user_cache.get(cache_key)
+
+    if cached_user:
+        _check_version(payload, cached_user.token_version)
+        note_request_user(cached_user.id)
+        return await session.merge(cached_user, load=False)
+
+    user_db = await session.scalar(
+        select(User).where(User.username == username)
+    )
+
+    if not user_db:
+        raise _credentials_exception()
+
+    _check_version(payload, user_db.token_version)
+    user_cache.set(cache_key, _detached_copy(user_db))
+    token_versions.set(user_db.id, user_db.token_version)
+    note_request_user(user_db.id)
+
+    return user_db
+
+
+def _token_version_query(user_id: int):
+    return select(User.token_version).where(User.id == user_id)
+
+
+def _authorize_claims(payload: dict, version: int | None) -> TokenUser:
+    if payload["ver"] != version:
+        raise _credentials_exception()
+
+    note_request_user(payload["uid"])
+
+    return TokenUser(id=payload["uid"], username=payload["sub"])
+
+
+def get_token_user(
+    session: Session = Depends(get_session),
+    token: str = Depends(oauth2_scheme),
+) -> TokenUser:
+    """Authorize from the token's `uid` and `ver` claims, without the user.
+
+    Only the user's token version is checked, from `token_versions` or,
+    on a miss, with a primary key read. Tokens without the claims fall
+    back to `get_current_user`. Routes that need the full `User` row
+    depend on `get_current_user` instead.
+    """
+    payload = _decode(token)
+
+    if "uid" not in payload or "ver" not in payload:
+        user = get_current_user(session, token)
+        return TokenUser(id=user.id, username=user.username)
+
+    version = token_versions.get(payload["uid"])
+
+    if version is None:
+        version = session.scalar(_token_version_query(payload["uid"]))
+        token_versions.set(payload["uid"], -1 if version is None else version)
+
+    return _authorize_claims(payload, version)
+
+
+async def get_token_user_async(
+    session: AsyncSession = Depends(get_async_session),
+    token: str = Depends(oauth2_scheme),
+) -> TokenUser:
+    """Async twin of `get_token_user`."""
+    payload = _decode(token)
+
+    if "uid" not in payload or "ver" not in payload:
+        user = await get_current_user_async(session, token)
+        return TokenUser(id=user.id, username=user.username)
+
+    version = token_versions.get(payload["uid"])
+
+    if version is None:
+        version = await session.scalar(_token_version_query(payload["uid"]))
+        token_versions.set(payload["uid"], -1 if version is None else version)
+
+    return _authorize_claims(payload, version)
+
+
+def require_admin(
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Let the request through only with the configured admin token.
+
+    Without an `ADMIN_TOKEN` setting the admin endpoints are closed.
+    """
+    if not (
+        settings.ADMIN_TOKEN
+        and x_admin_token
+        and compare_digest(x_admin_token, settings.ADMIN_TOKEN)
+    ):
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Not enough permissions",
+        )
@@ -10,3 +10,40 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
+
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_RECYCLE: int = -1
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_NULL_POOL: bool = False
+
+    PASSWORD_HASH_TIME_COST: int = 3
+    PASSWORD_HASH_MEMORY_COST: int = 65536
+    PASSWORD_HASH_PARALLELISM: int = 4
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
+    USER_CACHE_MAXSIZE: int = 1024
+    USER_CACHE_TTL: float = 60
+    TOKEN_VERSION_CACHE_TTL: float = 60
+
+    RESPONSE_CACHE_ENABLED: bool = False
+    RESPONSE_CACHE_MAXSIZE: int = 4096
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_TTL: float = 300
+
+    SERVER_TIMING_ENABLED: bool = True
+
+    SLOW_QUERY_THRESHOLD_MS: float = 500
+    SLOW_QUERY_LOG_SIZE: int = 100
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
+    SLOW_QUERY_EXPLAIN_QUEUE_SIZE: int = 10
+
+    ADMIN_TOKEN: str | None = None
+
+    ASYNC_DATABASE: bool = False
+
+    MONTH_ROLLOVER_CHUNK_SIZE: int = 1000
+    MONTH_ROLLOVER_RESUME: bool = False
+    MONTH_ROLLOVER_STALE_SECONDS: float = 600
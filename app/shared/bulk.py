@@ -0,0 +1,153 @@
+"""Bulk writes shared by the income and expense routers.
+
+Each operation checks ownership with one query per table, writes the
+valid items with one statement and commits once. Items that fail a
+check are reported by their position in the request instead of
+failing the whole batch.
+"""
+
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.member import Member
+from app.shared.versioning import bump_data_version
+
+
+def _owned_members(
+    session: Session, user_id: int, member_ids: set[int]
+) -> dict[int, dict]:
+    rows = session.execute(
+        select(Member.id, Member.name).where(
+            Member.id.in_(member_ids), Member.id_user_fk == user_id
+        )
+    )
+
+    return {row.id: {"id": row.id, "name": row.name} for row in rows}
+
+
+def bulk_create(
+    session: Session, model, user_id: int, items: list[BaseModel]
+) -> dict:
+    """Insert `items` for the user with one multi-row INSERT RETURNING."""
+    members = _owned_members(
+        session, user_id, {item.id_member_fk for item in items}
+    )
+    rows = []
+    errors = []
+
+    for index, item in enumerate(items):
+        if item.id_member_fk not in members:
+            errors.append({"index": index, "detail": "Member not found"})
+            continue
+
+        rows.append({**item.model_dump(), "id_user_fk": user_id})
+
+    created = []
+
+    if rows:
+        result = session.execute(
+            insert(model).returning(
+                *model.__table__.columns, sort_by_parameter_order=True
+            ),
+            rows,
+        )
+        created = [
+            {**row._asdict(), "member": members[row.id_member_fk]}
+            for row in result
+        ]
+        bump_data_version(session, user_id)
+
+    session.commit()
+
+    return {"items": created, "errors": errors}
+
+
+def bulk_update(
+    session: Session,
+    model,
+    user_id: int,
+    items: list[BaseModel],
+    not_found_detail: str,
+) -> dict:
+    """Update the user's rows in `items`, matched by their `id`."""
+    owned_ids = set(
+        session.scalars(
+            select(model.id).where(
+                model.id.in_({item.id for item in items}),
+                model.id_user_fk == user_id,
+            )
+        )
+    )
+    members = _owned_members(
+        session, user_id, {item.id_member_fk for item in items}
+    )
+    rows = []
+    errors = []
+
+    for index, item in enumerate(items):
+        if item.id not in owned_ids:
+            errors.append({"index": index, "detail": not_found_detail})
+            continue
+
+        if item.id_member_fk not in members:
+            errors.append({"index": index, "detail": "Member not found"})
+            continue
+
+        rows.append(item.model_dump())
+
+    updated = []
+
+    if rows:
+        session.execute(update(model), rows)
+
+        result = session.execute(
+            select(*model.__table__.columns).where(
+                model.id.in_({row["id"] for row in rows})
+            )
+        )
+        by_id = {
+            row.id: {**row._asdict(), "member": members[row.id_member_fk]}
+            for row in result
+        }
+        updated = [by_id[row["id"]] for row in rows]
+        bump_data_version(session, user_id)
+
+    session.commit()
+
+    return {"items": updated, "errors": errors}
+
+
+def bulk_delete(
+    session: Session,
+    model,
+    user_id: int,
+    ids: list[int],
+    not_found_detail: str,
+) -> dict:
+    """Delete the user's rows in `ids` with one DELETE RETURNING.
+
+    An id sent twice is listed as deleted once.
+    """
+    deleted = set(
+        session.scalars(
+            delete(model)
+            .where(model.id.in_(ids), model.id_user_fk == user_id)
+            .returning(model.id)
+            .execution_options(synchronize_session=False)
+        )
+    )
+
+    if deleted:
+        bump_data_version(session, user_id)
+
+    session.commit()
+
+    return {
+        "deleted": [id_ for id_ in dict.fromkeys(ids) if id_ in deleted],
+        "errors": [
+            {"index": index, "detail": not_found_detail}
+            for index, id_ in enumerate(ids)
+            if id_ not in deleted
+        ],
+    }
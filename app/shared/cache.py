@@ -0,0 +1,112 @@
+"""In-process caches and the interface shared cache backends follow."""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from threading import Lock
+from time import monotonic
+from typing import Any, Protocol
+
+
+class CacheBackend(Protocol):
+    """Storage behind a cache, local to the process or shared."""
+
+    def get(self, key: Hashable) -> Any | None: ...
+
+    def set(self, key: Hashable, value: Any) -> None: ...
+
+    def delete(self, key: Hashable) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> dict: ...
+
+
+class LocalCache:
+    """Bounded LRU cache whose entries expire `ttl` seconds after set.
+
+    `max_bytes` also caps the total length of the values, which must then
+    be `bytes`; the least recently used entries go first either way.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = monotonic,
+        max_bytes: int | None = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any, int]] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= self._clock():
+                self._pop(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+
+        size = 0
+
+        if self.max_bytes is not None:
+            size = len(value)
+
+            if size > self.max_bytes:
+                return
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (self._clock() + self.ttl, value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.maxsize or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,64 @@
+"""Conditional GETs answered from the user's data version."""
+
+from http import HTTPStatus
+from typing import Annotated
+from zlib import crc32
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import get_async_session, get_session
+from app.security import TokenUser, get_token_user, get_token_user_async
+from app.shared.versioning import get_data_version, get_data_version_async
+
+
+def _etag(request: Request, user_id: int, version: int) -> str:
+    resource = f"{request.url.path}?{request.url.query}".encode()
+
+    return f'"{user_id}-{version}-{crc32(resource):08x}"'
+
+
+def _respond(request: Request, response: Response, etag: str) -> None:
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    }
+
+    if etag in candidates or "*" in candidates:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_MODIFIED, headers={"ETag": etag}
+        )
+
+    response.headers["ETag"] = etag
+
+
+def check_etag(
+    request: Request,
+    response: Response,
+    session: Annotated[Session, Depends(get_session)],
+    current_user: Annotated[TokenUser, Depends(get_token_user)],
+) -> None:
+    """Answer 304 when the client already has this version of the data.
+
+    Only the version row is read, so an unchanged poll skips the list
+    queries and the serialization. Otherwise the ETag is set on the
+    response the route builds.
+    """
+    version = get_data_version(session, current_user.id)
+    request.state.data_version = version
+
+    _respond(request, response, _etag(request, current_user.id, version))
+
+
+async def check_etag_async(
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    current_user: Annotated[TokenUser, Depends(get_token_user_async)],
+) -> None:
+    """Async twin of `check_etag`."""
+    version = await get_data_version_async(session, current_user.id)
+    request.state.data_version = version
+
+    _respond(request, response, _etag(request, current_user.id, version))
@@ -0,0 +1,76 @@
+"""Bounded executor for the CPU-heavy password hashing."""
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from http import HTTPStatus
+from threading import BoundedSemaphore, Lock
+from typing import Any
+
+from fastapi import HTTPException
+
+
+class HashingExecutor:
+    """Run hashing on `max_workers` threads with at most `max_queue` waiting.
+
+    Argon2 releases the GIL while it hashes, so the dedicated threads cap
+    how much CPU a login storm takes without blocking the request
+    threadpool. Work beyond the queue is refused with a 503 instead of
+    piling up behind it.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.running = 0
+        self.rejected = 0
+        self._in_flight = 0
+        self._slots = BoundedSemaphore(max_workers + max_queue)
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hashing"
+        )
+
+    def submit(self, fn: Callable[..., Any], *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+
+            raise HTTPException(
+                status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+                detail="Too many password checks in progress",
+                headers={"Retry-After": "1"},
+            )
+
+        with self._lock:
+            self._in_flight += 1
+
+        future = self._executor.submit(self._run, fn, *args)
+        future.add_done_callback(self._release)
+
+        return future
+
+    def _run(self, fn: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            self.running += 1
+
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+        self._slots.release()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self.running,
+                "queue_depth": self._in_flight - self.running,
+                "rejected": self.rejected,
+            }
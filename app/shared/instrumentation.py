@@ -0,0 +1,328 @@
+"""Per-route request latency and database cost.
+
+`instrument_engine` hooks an engine's cursor executions and the
+`InstrumentationMiddleware` charges them to the request being served,
+so each route gets a latency histogram and its statement count, DB time
+and rows. The totals are rendered for `/metrics` in the Prometheus text
+format and each response gets them in a `Server-Timing` header.
+"""
+
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+@dataclass
+class RequestCost:
+    """Database work done while serving one request, and for whom."""
+
+    statements: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+    scope: Scope | None = field(default=None, repr=False)
+    user_id: int | None = None
+
+    @property
+    def route(self) -> str | None:
+        route = self.scope.get("route") if self.scope else None
+
+        return route.path if route is not None else None
+
+
+_request_cost: ContextVar[RequestCost | None] = ContextVar(
+    "request_cost", default=None
+)
+
+
+def current_request() -> RequestCost | None:
+    """The cost of the request being served, if any."""
+    return _request_cost.get()
+
+
+def note_request_user(user_id: int) -> None:
+    """Attribute the request being served to `user_id`."""
+    cost = _request_cost.get()
+
+    if cost is not None:
+        cost.user_id = user_id
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    if context is not None and _request_cost.get() is not None:
+        context._instrumentation_started = perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    cost = _request_cost.get()
+    started = getattr(context, "_instrumentation_started", None)
+
+    if cost is None or started is None:
+        return
+
+    cost.statements += 1
+    cost.db_seconds += perf_counter() - started
+    cost.rows += max(cursor.rowcount, 0)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Charge the statements `engine` runs to the current request."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class Histogram:
+    """Counts of observations per bucket upper bound, plus their sum."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        bounds = [f"{bound:g}" for bound in self.buckets] + ["+Inf"]
+        total = 0
+        result = []
+
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            result.append((bound, total))
+
+        return result
+
+
+@dataclass
+class RouteStats:
+    """What the requests to one route cost."""
+
+    latency: Histogram = field(
+        default_factory=lambda: Histogram(LATENCY_BUCKETS)
+    )
+    statements: Histogram = field(
+        default_factory=lambda: Histogram(STATEMENT_BUCKETS)
+    )
+    db_seconds: float = 0.0
+    rows: int = 0
+    responses: dict[int, int] = field(default_factory=dict)
+
+
+def _labels(**labels) -> str:
+    pairs = (f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+    return "{" + ",".join(pairs) + "}"
+
+
+def _escape(value) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+class RequestMetrics:
+    """Statistics of the requests this process served, by route."""
+
+    def __init__(self):
+        self._routes: dict[tuple[str, str], RouteStats] = {}
+        self._lock = Lock()
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        cost: RequestCost,
+    ) -> None:
+        with self._lock:
+            stats = self._routes.setdefault((method, route), RouteStats())
+            stats.latency.observe(seconds)
+            stats.statements.observe(cost.statements)
+            stats.db_seconds += cost.db_seconds
+            stats.rows += cost.rows
+            stats.responses[status] = stats.responses.get(status, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def render(self) -> str:
+        """Render the statistics in the Prometheus text format."""
+        with self._lock:
+            routes = sorted(self._routes.items())
+            lines = [
+                "# HELP http_requests_total Requests served, by status.",
+                "# TYPE http_requests_total counter",
+            ]
+
+            for (method, route), stats in routes:
+                for status, count in sorted(stats.responses.items()):
+                    labels = _labels(method=method, route=route, status=status)
+                    lines.append(f"http_requests_total{labels} {count}")
+
+            for name, help_, attribute in (
+                (
+                    "http_request_duration_seconds",
+                    "Time to serve a request.",
+                    "latency",
+                ),
+                (
+                    "http_request_db_statements",
+                    "Database statements run per request.",
+                    "statements",
+                ),
+            ):
+                lines.append(f"# HELP {name} {help_}")
+                lines.append(f"# TYPE {name} histogram")
+
+                for (method, route), stats in routes:
+                    histogram = getattr(stats, attribute)
+                    labels = dict(method=method, route=route)
+
+                    for bound, count in histogram.cumulative():
+                        bucket = _labels(**labels, le=bound)
+                        lines.append(f"{name}_bucket{bucket} {count}")
+
+                    lines.append(
+                        f"{name}_sum{_labels(**labels)} {histogram.sum:g}"
+                    )
+                    lines.append(
+                        f"{name}_count{_labels(**labels)} {histogram.count}"
+                    )
+
+            for name, help_, attribute in (
+                (
+                    "http_request_db_seconds_total",
+                    "Time spent in database statements.",
+                    "db_seconds",
+                ),
+                (
+                    "http_request_db_rows_total",
+                    "Rows returned or changed by database statements.",
+                    "rows",
+                ),
+            ):
+                lines.append(f"# HELP {name} {help_}")
+                lines.append(f"# TYPE {name} counter")
+
+                for (method, route), stats in routes:
+                    labels = _labels(method=method, route=route)
+                    value = getattr(stats, attribute)
+                    lines.append(f"{name}{labels} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+
+def server_timing(cost: RequestCost, seconds: float) -> str:
+    """Format a request's database cost and time as a Server-Timing value."""
+    return (
+        f"db;dur={cost.db_seconds * 1000:.2f};"
+        f'desc="{cost.statements} statements/{cost.rows} rows", '
+        f"app;dur={seconds * 1000:.2f}"
+    )
+
+
+class InstrumentationMiddleware:
+    """Time each request and record it, with its database cost, by route.
+
+    The `Server-Timing` header covers the work done before the response
+    started; statements run while a streamed body is sent still count in
+    the route's statistics, but background tasks run after it do not.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: RequestMetrics = request_metrics,
+        server_timing: bool = True,
+    ):
+        self.app = app
+        self.metrics = metrics
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        cost = RequestCost(scope=scope)
+        token = _request_cost.set(cost)
+        started = perf_counter()
+        status = 500
+        recorded = False
+
+        def record() -> None:
+            nonlocal recorded
+
+            if not recorded:
+                recorded = True
+                self.metrics.record(
+                    scope["method"],
+                    cost.route or "unmatched",
+                    status,
+                    perf_counter() - started,
+                    cost,
+                )
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+                if self.server_timing:
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing",
+                        server_timing(cost, perf_counter() - started),
+                    )
+
+            await send(message)
+
+            # Background tasks run after the last body message; they are
+            # not part of the request's latency.
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                record()
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_cost.reset(token)
+            record()
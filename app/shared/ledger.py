@@ -0,0 +1,728 @@
+"""CRUD engine shared by the income and expense resources.
+
+Incomes, essential expenses and non essential expenses are the same
+kind of ledger line: a named value owned by a user and attributed to one
+of the user's members. Each module describes its resource with a
+`LedgerResource` and gets its routers from `ledger_router` and
+`ledger_async_router`, so member checks, listing, caching and bulk
+writes live in one place.
+"""
+
+from dataclasses import dataclass
+from http import HTTPStatus
+from math import ceil
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
+from pydantic import BaseModel
+from sqlalchemy import CTE, delete, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import get_async_session, get_session
+from app.models.member import Member
+from app.security import TokenUser, get_token_user, get_token_user_async
+from app.shared.bulk import bulk_create, bulk_delete, bulk_update
+from app.shared.etag import check_etag, check_etag_async
+from app.shared.listing import rows_with_member, select_with_member
+from app.shared.pagination import (
+    IncludeTotal,
+    T_Page,
+    T_PerPage,
+    count_total,
+    paginate_by_cursor,
+)
+from app.shared.response_cache import (
+    CachingRoute,
+    use_response_cache,
+    use_response_cache_async,
+)
+from app.shared.responses import model_response
+from app.shared.schemas.bulk import BulkDelete, BulkDeleteResult
+from app.shared.schemas.utils import Message
+from app.shared.versioning import bump_data_version_after
+
+T_Session = Annotated[Session, Depends(get_session)]
+T_CurrentUser = Annotated[TokenUser, Depends(get_token_user)]
+T_AsyncSession = Annotated[AsyncSession, Depends(get_async_session)]
+T_AsyncCurrentUser = Annotated[TokenUser, Depends(get_token_user_async)]
+
+
+@dataclass(frozen=True)
+class LedgerResource:
+    """A ledger model and the schemas its routes read and return."""
+
+    model: type
+    label: str
+    schema: type[BaseModel]
+    public: type[BaseModel]
+    paginated: type[BaseModel]
+    cursor_paginated: type[BaseModel]
+    bulk_create: type[BaseModel]
+    bulk_update: type[BaseModel]
+    bulk_result: type[BaseModel]
+
+    @property
+    def name(self) -> str:
+        return self.label.replace(" ", "_")
+
+    @property
+    def plural(self) -> str:
+        return f"{self.label}s"
+
+    @property
+    def not_found(self) -> str:
+        return f"{self.label.capitalize()} not found"
+
+
+def _owned_member_cte(user_id: int, member_id: int) -> CTE:
+    return (
+        select(Member.id, Member.name)
+        .where(Member.id == member_id, Member.id_user_fk == user_id)
+        .cte("owned_member")
+    )
+
+
+def _member_error(
+    session: Session, user_id: int, member_id: int
+) -> HTTPException:
+    owner = session.scalar(
+        select(Member.id_user_fk).where(Member.id == member_id)
+    )
+    status = (
+        HTTPStatus.FORBIDDEN
+        if owner not in (None, user_id)
+        else HTTPStatus.NOT_FOUND
+    )
+
+    return HTTPException(status_code=status, detail="Member not found")
+
+
+def _item_error(
+    resource: LedgerResource,
+    session: Session,
+    user_id: int,
+    item_id: int,
+    action: str,
+) -> HTTPException | None:
+    model = resource.model
+    owner = session.scalar(select(model.id_user_fk).where(model.id == item_id))
+
+    if owner is None:
+        return HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=resource.not_found,
+        )
+
+    if owner != user_id:
+        return HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail=(
+                f"You don't have permission to {action} this "
+                f"{resource.label}"
+            ),
+        )
+
+    return None
+
+
+def _write(
+    resource: LedgerResource,
+    session: Session,
+    user_id: int,
+    written: CTE,
+    member: CTE,
+) -> dict | None:
+    """Run the write in `written` and return the line it wrote, if any.
+
+    The write, the member it is checked against and the user's version
+    bump are one statement, and RETURNING hands back the server-set
+    columns, so a write costs a single round trip.
+    """
+    columns = [
+        written.c[name]
+        for name in resource.public.model_fields
+        if name != "member"
+    ]
+    rows = session.execute(
+        select(
+            *columns,
+            member.c.id.label("member_id"),
+            member.c.name.label("member_name"),
+        )
+        .join_from(written, member, member.c.id == written.c.id_member_fk)
+        .add_cte(bump_data_version_after(user_id, written))
+    )
+    items = rows_with_member(rows)
+
+    return items[0] if items else None
+
+
+def create_item(
+    resource: LedgerResource,
+    session: Session,
+    current_user: TokenUser,
+    item: BaseModel,
+) -> dict:
+    """Create a line attributed to one of the user's members."""
+    model = resource.model
+    member = _owned_member_cte(current_user.id, item.id_member_fk)
+    values = {
+        **item.model_dump(exclude={"id_member_fk"}),
+        "id_user_fk": current_user.id,
+    }
+    columns = model.__table__.c
+    written = (
+        insert(model)
+        .from_select(
+            [*values, "id_member_fk"],
+            select(
+                *(
+                    literal(value, columns[name].type)
+                    for name, value in values.items()
+                ),
+                member.c.id,
+            ),
+        )
+        .returning(*columns)
+        .cte("written")
+    )
+
+    created = _write(resource, session, current_user.id, written, member)
+
+    if created is None:
+        raise _member_error(session, current_user.id, item.id_member_fk)
+
+    session.commit()
+
+    return created
+
+
+def list_items(
+    resource: LedgerResource,
+    session: Session,
+    current_user: TokenUser,
+    response: Response,
+    page: int = 1,
+    per_page: int = 10,
+    name: str = None,
+    cursor: str = None,
+    include_total: IncludeTotal = None,
+) -> Response:
+    """List the user's lines by page or by keyset cursor.
+
+    The total is counted exactly in page mode and skipped in cursor mode
+    unless `include_total` asks otherwise.
+    """
+    model = resource.model
+    query = select_with_member(model, resource.public).filter(
+        model.id_user_fk == current_user.id
+    )
+
+    if name:
+        query = query.filter(model.name.ilike(f"%{name}%"))
+
+    if cursor is not None:
+        total = count_total(
+            session, query, include_total or IncludeTotal.FALSE
+        )
+        items, next_cursor = paginate_by_cursor(
+            session, query, model, cursor, per_page
+        )
+
+        return model_response(
+            resource.cursor_paginated,
+            response,
+            {
+                "items": rows_with_member(items),
+                "pagination": {
+                    "count": len(items),
+                    "per_page": per_page,
+                    "next_cursor": next_cursor,
+                    "total": total,
+                },
+            },
+        )
+
+    total = count_total(session, query, include_total or IncludeTotal.EXACT)
+
+    offset = (page - 1) * per_page
+
+    items = rows_with_member(
+        session.execute(
+            query.order_by(model.updated_at.desc(), model.id.desc())
+            .limit(per_page)
+            .offset(offset)
+        )
+    )
+
+    total_pages = None
+
+    if total is not None:
+        total_pages = ceil(total / per_page) if total > 0 else 1
+
+    return model_response(
+        resource.paginated,
+        response,
+        {
+            "items": items,
+            "pagination": {
+                "count": len(items),
+                "page": page,
+                "per_page": per_page,
+                "total": total,
+                "total_pages": total_pages,
+            },
+        },
+    )
+
+
+def read_item(
+    resource: LedgerResource,
+    session: Session,
+    current_user: TokenUser,
+    item_id: int,
+):
+    """Get one of the user's lines."""
+    model = resource.model
+    item = session.execute(
+        select(model)
+        .filter(model.id == item_id)
+        .filter(model.id_user_fk == current_user.id)
+    ).scalar()
+
+    if not item:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=resource.not_found,
+        )
+
+    return item
+
+
+def update_item(
+    resource: LedgerResource,
+    session: Session,
+    current_user: TokenUser,
+    item_id: int,
+    item: BaseModel,
+) -> dict:
+    """Replace the fields of one of the user's lines."""
+    model = resource.model
+    member = _owned_member_cte(current_user.id, item.id_member_fk)
+    written = (
+        update(model)
+        .where(
+            model.id == item_id,
+            model.id_user_fk == current_user.id,
+            select(member.c.id).exists(),
+        )
+        .values(**item.model_dump())
+        .returning(*model.__table__.columns)
+        .cte("written")
+    )
+
+    updated = _write(resource, session, current_user.id, written, member)
+
+    if updated is None:
+        raise _item_error(
+            resource, session, current_user.id, item_id, "update"
+        ) or _member_error(session, current_user.id, item.id_member_fk)
+
+    session.commit()
+
+    return updated
+
+
+def delete_item(
+    resource: LedgerResource,
+    session: Session,
+    current_user: TokenUser,
+    item_id: int,
+) -> dict:
+    """Delete one of the user's lines."""
+    model = resource.model
+    written = (
+        delete(model)
+        .where(model.id == item_id, model.id_user_fk == current_user.id)
+        .returning(model.id)
+        .cte("written")
+    )
+
+    deleted = session.scalar(
+        select(written.c.id).add_cte(
+            bump_data_version_after(current_user.id, written)
+        )
+    )
+
+    if deleted is None:
+        raise _item_error(
+            resource, session, current_user.id, item_id, "delete"
+        ) or HTTPException(
+            status_code=HTTPStatus.NOT_FOUND,
+            detail=resource.not_found,
+        )
+
+    session.commit()
+
+    return {"message": f"{resource.label.capitalize()} deleted successfully"}
+
+
+def ledger_router(
+    resource: LedgerResource, prefix: str, tags: list[str]
+) -> APIRouter:
+    """Build the routes of a ledger resource."""
+    router = APIRouter(prefix=prefix, tags=tags, route_class=CachingRoute)
+    id_param = f"{resource.name}_id"
+    T_ItemId = Annotated[int, Path(alias=id_param)]
+
+    def create(
+        item: resource.schema,
+        session: T_Session,
+        current_user: T_CurrentUser,
+    ):
+        return create_item(resource, session, current_user, item)
+
+    def list_(
+        session: T_Session,
+        current_user: T_CurrentUser,
+        response: Response,
+        page: T_Page = 1,
+        per_page: T_PerPage = 10,
+        name: str = None,
+        cursor: str = None,
+        include_total: IncludeTotal = None,
+    ):
+        return list_items(
+            resource,
+            session,
+            current_user,
+            response,
+            page,
+            per_page,
+            name,
+            cursor,
+            include_total,
+        )
+
+    def bulk_create_(
+        items: resource.bulk_create,
+        session: T_Session,
+        current_user: T_CurrentUser,
+    ):
+        return bulk_create(
+            session, resource.model, current_user.id, items.items
+        )
+
+    def bulk_update_(
+        items: resource.bulk_update,
+        session: T_Session,
+        current_user: T_CurrentUser,
+    ):
+        return bulk_update(
+            session,
+            resource.model,
+            current_user.id,
+            items.items,
+            resource.not_found,
+        )
+
+    def bulk_delete_(
+        items: BulkDelete,
+        session: T_Session,
+        current_user: T_CurrentUser,
+    ):
+        return bulk_delete(
+            session,
+            resource.model,
+            current_user.id,
+            items.ids,
+            resource.not_found,
+        )
+
+    def read(
+        item_id: T_ItemId, session: T_Session, current_user: T_CurrentUser
+    ):
+        return read_item(resource, session, current_user, item_id)
+
+    def update(
+        item_id: T_ItemId,
+        item: resource.schema,
+        session: T_Session,
+        current_user: T_CurrentUser,
+    ):
+        return update_item(resource, session, current_user, item_id, item)
+
+    def delete(
+        item_id: T_ItemId, session: T_Session, current_user: T_CurrentUser
+    ):
+        return delete_item(resource, session, current_user, item_id)
+
+    _add_routes(
+        router,
+        resource,
+        {
+            "create": create,
+            "list": list_,
+            "bulk_create": bulk_create_,
+            "bulk_update": bulk_update_,
+            "bulk_delete": bulk_delete_,
+            "read": read,
+            "update": update,
+            "delete": delete,
+        },
+        check_etag,
+        use_response_cache,
+    )
+
+    return router
+
+
+def ledger_async_router(
+    resource: LedgerResource, prefix: str, tags: list[str]
+) -> APIRouter:
+    """Build the routes of a ledger resource for the async database mode.
+
+    The handlers run the sync engine through `AsyncSession.run_sync`, so
+    the queries are awaited on the event loop instead of a threadpool
+    worker.
+    """
+    router = APIRouter(
+        prefix=prefix,
+        tags=tags,
+        include_in_schema=False,
+        route_class=CachingRoute,
+    )
+    id_param = f"{resource.name}_id"
+    T_ItemId = Annotated[int, Path(alias=id_param)]
+
+    async def create(
+        item: resource.schema,
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+    ):
+        return await session.run_sync(
+            lambda sync_session: create_item(
+                resource, sync_session, current_user, item
+            )
+        )
+
+    async def list_(
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+        response: Response,
+        page: T_Page = 1,
+        per_page: T_PerPage = 10,
+        name: str = None,
+        cursor: str = None,
+        include_total: IncludeTotal = None,
+    ):
+        return await session.run_sync(
+            lambda sync_session: list_items(
+                resource,
+                sync_session,
+                current_user,
+                response,
+                page,
+                per_page,
+                name,
+                cursor,
+                include_total,
+            )
+        )
+
+    async def bulk_create_(
+        items: resource.bulk_create,
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+    ):
+        return await session.run_sync(
+            lambda sync_session: bulk_create(
+                sync_session, resource.model, current_user.id, items.items
+            )
+        )
+
+    async def bulk_update_(
+        items: resource.bulk_update,
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+    ):
+        return await session.run_sync(
+            lambda sync_session: bulk_update(
+                sync_session,
+                resource.model,
+                current_user.id,
+                items.items,
+                resource.not_found,
+            )
+        )
+
+    async def bulk_delete_(
+        items: BulkDelete,
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+    ):
+        return await session.run_sync(
+            lambda sync_session: bulk_delete(
+                sync_session,
+                resource.model,
+                current_user.id,
+                items.ids,
+                resource.not_found,
+            )
+        )
+
+    async def read(
+        item_id: T_ItemId,
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+    ):
+        return await session.run_sync(
+            lambda sync_session: read_item(
+                resource, sync_session, current_user, item_id
+            )
+        )
+
+    async def update(
+        item_id: T_ItemId,
+        item: resource.schema,
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+    ):
+        return await session.run_sync(
+            lambda sync_session: update_item(
+                resource, sync_session, current_user, item_id, item
+            )
+        )
+
+    async def delete(
+        item_id: T_ItemId,
+        session: T_AsyncSession,
+        current_user: T_AsyncCurrentUser,
+    ):
+        return await session.run_sync(
+            lambda sync_session: delete_item(
+                resource, sync_session, current_user, item_id
+            )
+        )
+
+    _add_routes(
+        router,
+        resource,
+        {
+            "create": create,
+            "list": list_,
+            "bulk_create": bulk_create_,
+            "bulk_update": bulk_update_,
+            "bulk_delete": bulk_delete_,
+            "read": read,
+            "update": update,
+            "delete": delete,
+        },
+        check_etag_async,
+        use_response_cache_async,
+    )
+
+    return router
+
+
+def _add_routes(router, resource, handlers, etag, cache) -> None:
+    """Register the handlers under the names the per-module routers had.
+
+    `/bulk` goes before the `/{id}` routes so it is not read as an id.
+    """
+    name, plural, label = resource.name, f"{resource.name}s", resource.label
+    article = "an" if label[0] in "aeiou" else "a"
+    item_path = f"/{{{name}_id}}"
+    specs = (
+        (
+            "create",
+            "/",
+            "POST",
+            f"create_{name}",
+            f"Create a new {label}.",
+            resource.public,
+            [],
+        ),
+        (
+            "list",
+            "/",
+            "GET",
+            f"get_{plural}_paginated",
+            f"Get all {resource.plural} by page or by keyset cursor.\n\n"
+            "The total is counted exactly in page mode and skipped in "
+            "cursor mode\nunless `include_total` asks otherwise.",
+            resource.paginated | resource.cursor_paginated,
+            [Depends(etag), Depends(cache)],
+        ),
+        (
+            "bulk_create",
+            "/bulk",
+            "POST",
+            f"bulk_create_{plural}",
+            f"Create many {resource.plural} in one statement.",
+            resource.bulk_result,
+            [],
+        ),
+        (
+            "bulk_update",
+            "/bulk",
+            "PUT",
+            f"bulk_update_{plural}",
+            f"Update many {resource.plural} in one statement.",
+            resource.bulk_result,
+            [],
+        ),
+        (
+            "bulk_delete",
+            "/bulk",
+            "DELETE",
+            f"bulk_delete_{plural}",
+            f"Delete many {resource.plural} in one statement.",
+            BulkDeleteResult,
+            [],
+        ),
+        (
+            "read",
+            item_path,
+            "GET",
+            f"get_{name}",
+            f"Get a single {label}.",
+            resource.schema,
+            [Depends(etag)],
+        ),
+        (
+            "update",
+            item_path,
+            "PUT",
+            f"update_{name}",
+            f"Update {article} {label}.",
+            resource.public,
+            [],
+        ),
+        (
+            "delete",
+            item_path,
+            "DELETE",
+            f"delete_{name}",
+            f"Delete {article} {label}.",
+            Message,
+            [],
+        ),
+    )
+
+    for key, path, method, route_name, description, model, deps in specs:
+        router.add_api_route(
+            path,
+            handlers[key],
+            methods=[method],
+            name=route_name,
+            description=description,
+            response_model=model,
+            status_code=(
+                HTTPStatus.CREATED
+                if key in {"create", "bulk_create"}
+                else None
+            ),
+            dependencies=deps,
+        )
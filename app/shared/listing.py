@@ -0,0 +1,44 @@
+"""Column-projected list queries for the income and expense routers."""
+
+from pydantic import BaseModel
+from sqlalchemy import Select, select
+
+from app.models.member import Member
+
+
+def select_with_member(model, schema: type[BaseModel]) -> Select:
+    """Select the columns of `model` that `schema` shows, plus its member.
+
+    Only those columns are fetched, as plain rows, and the member's id and
+    name come from a join, so a page is one query with no entities to
+    track in the session.
+    """
+    columns = [
+        getattr(model, name)
+        for name in schema.model_fields
+        if name != "member"
+    ]
+
+    return select(
+        *columns,
+        Member.id.label("member_id"),
+        Member.name.label("member_name"),
+    ).outerjoin(Member, Member.id == model.id_member_fk)
+
+
+def rows_with_member(rows) -> list[dict]:
+    """Turn rows of `select_with_member` into response items."""
+    items = []
+
+    for row in rows:
+        item = row._asdict()
+        member_id = item.pop("member_id")
+        member_name = item.pop("member_name")
+        item["member"] = (
+            {"id": member_id, "name": member_name}
+            if member_id is not None
+            else None
+        )
+        items.append(item)
+
+    return items
@@ -0,0 +1,106 @@
+"""Pagination helpers shared by the list routers."""
+
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from enum import Enum
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import HTTPException, Query
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session
+
+MAX_PER_PAGE = 100
+
+T_Page = Annotated[int, Query(ge=1)]
+T_PerPage = Annotated[int, Query(ge=1, le=MAX_PER_PAGE)]
+
+
+class IncludeTotal(str, Enum):
+    """How the list routers compute the `total` of a listing."""
+
+    FALSE = "false"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+def encode_cursor(updated_at: datetime, id_: int) -> str:
+    """Build the opaque token pointing right after the given row."""
+    payload = json.dumps([updated_at.isoformat(), id_]).encode()
+
+    return urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Read back the `(updated_at, id)` pair stored in a cursor."""
+    padding = "=" * (-len(cursor) % 4)
+
+    try:
+        updated_at, id_ = json.loads(urlsafe_b64decode(cursor + padding))
+        return datetime.fromisoformat(updated_at), int(id_)
+    except (BinasciiError, TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=HTTPStatus.BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from exc
+
+
+def paginate_by_cursor(
+    session: Session,
+    query: Select,
+    model,
+    cursor: str,
+    per_page: int,
+):
+    """Fetch the page after `cursor` ordered by `updated_at desc, id desc`.
+
+    An empty cursor returns the first page. The page is located with a
+    row comparison on `(updated_at, id)` instead of an offset, so the
+    cost does not grow with the depth of the page.
+    """
+    if cursor:
+        updated_at, id_ = decode_cursor(cursor)
+        query = query.filter(
+            tuple_(model.updated_at, model.id) < tuple_(updated_at, id_)
+        )
+
+    items = session.execute(
+        query.order_by(model.updated_at.desc(), model.id.desc()).limit(
+            per_page + 1
+        )
+    ).all()
+
+    next_cursor = None
+
+    if len(items) > per_page:
+        items = items[:per_page]
+        next_cursor = encode_cursor(items[-1].updated_at, items[-1].id)
+
+    return items, next_cursor
+
+
+def count_total(
+    session: Session, query: Select, include_total: IncludeTotal
+) -> int | None:
+    """Count the rows matched by `query` as requested by the client.
+
+    `exact` runs a COUNT over the query, `estimate` reads the row count
+    the planner expects for it from `EXPLAIN`, and `false` skips the
+    count altogether.
+    """
+    if include_total == IncludeTotal.EXACT:
+        return session.scalar(
+            select(func.count()).select_from(query.subquery())
+        )
+
+    if include_total == IncludeTotal.ESTIMATE:
+        compiled = query.compile(dialect=session.get_bind().dialect)
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+        )
+
+        return int(plan.scalar()[0]["Plan"]["Plan Rows"])
+
+    return None
@@ -0,0 +1,107 @@
+"""Opt-in cache of the serialized per-user list responses.
+
+Entries are keyed by the user's data version, so the writes that bump
+it make the old entries unreachable; they then age out of the LRU.
+"""
+
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import Depends, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.database import get_async_session, get_session, settings
+from app.security import TokenUser, get_token_user, get_token_user_async
+from app.shared.cache import CacheBackend, LocalCache
+from app.shared.versioning import get_data_version, get_data_version_async
+
+response_cache: CacheBackend = LocalCache(
+    maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+    ttl=settings.RESPONSE_CACHE_TTL,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
+
+
+class CachedResponse(Exception):
+    """Raised by the cache dependency to answer with a stored body."""
+
+    def __init__(self, body: bytes, headers: dict):
+        self.body = body
+        self.headers = headers
+
+
+class CachingRoute(APIRoute):
+    """Route that stores and replays the bodies the cache dependency keys."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def cached_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except CachedResponse as cached:
+                return Response(
+                    cached.body,
+                    media_type="application/json",
+                    headers=cached.headers,
+                )
+
+            key = getattr(request.state, "response_cache_key", None)
+
+            if key is not None and response.status_code == HTTPStatus.OK:
+                response_cache.set(key, response.body)
+
+            return response
+
+        return cached_handler
+
+
+def _lookup(
+    request: Request, response: Response, user_id: int, version: int
+) -> None:
+    key = (user_id, version, request.url.path, request.url.query)
+    body = response_cache.get(key)
+
+    if body is not None:
+        raise CachedResponse(body, dict(response.headers))
+
+    request.state.response_cache_key = key
+
+
+def use_response_cache(
+    request: Request,
+    response: Response,
+    session: Annotated[Session, Depends(get_session)],
+    current_user: Annotated[TokenUser, Depends(get_token_user)],
+) -> None:
+    """Serve the stored body for this user, version and query, if any."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+
+    version = getattr(request.state, "data_version", None)
+
+    if version is None:
+        version = get_data_version(session, current_user.id)
+
+    _lookup(request, response, current_user.id, version)
+
+
+async def use_response_cache_async(
+    request: Request,
+    response: Response,
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+    current_user: Annotated[TokenUser, Depends(get_token_user_async)],
+) -> None:
+    """Async twin of `use_response_cache`."""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+
+    version = getattr(request.state, "data_version", None)
+
+    if version is None:
+        version = await get_data_version_async(session, current_user.id)
+
+    _lookup(request, response, current_user.id, version)
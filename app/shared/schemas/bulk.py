@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+
+MAX_BULK_ITEMS = 10_000
+
+
+class BulkError(BaseModel):
+    index: int
+    detail: str
+
+
+class BulkDelete(BaseModel):
+    ids: list[int] = Field(max_length=MAX_BULK_ITEMS)
+
+
+class BulkDeleteResult(BaseModel):
+    deleted: list[int]
+    errors: list[BulkError]
@@ -0,0 +1,209 @@
+"""Log of the statements slower than a threshold, with sampled plans."""
+
+import logging
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from random import random
+from threading import BoundedSemaphore, Lock
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.database import settings
+from app.shared.instrumentation import current_request
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_LIST = re.compile(r"%\(\w+\)s(?:\s*,\s*%\(\w+\)s)+")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_LOCKING_CLAUSE = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b",
+    re.IGNORECASE,
+)
+
+
+def normalize_sql(statement: str) -> str:
+    """Reduce `statement` to its shape, so repeats of a query read alike.
+
+    Whitespace is collapsed, inline literals become `?` and expanded IN
+    lists become a single `%(...)s`.
+    """
+    statement = _PLACEHOLDER_LIST.sub("%(...)s", statement)
+    statement = _LITERAL.sub("?", statement)
+
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def parameter_shapes(parameters) -> dict[str, str]:
+    """Name the type of each bound parameter, leaving out the values."""
+    if isinstance(parameters, dict):
+        items = parameters.items()
+    else:
+        items = ((str(index), value) for index, value in enumerate(parameters))
+
+    return {name: type(value).__name__ for name, value in items}
+
+
+@dataclass
+class SlowQuery:
+    at: datetime
+    duration_ms: float
+    statement: str
+    parameters: dict[str, str]
+    batch_size: int
+    route: str | None
+    user_id: int | None
+    plan: str | None = None
+
+
+class SlowQueryLog:
+    """The last `maxsize` statements that took `threshold_ms` or longer.
+
+    A `sample_rate` share of them get their plan captured on a
+    background thread: EXPLAIN ANALYZE with BUFFERS for plain SELECTs,
+    and the estimated plan for anything that writes or takes row locks,
+    which ANALYZE would do a second time. At most `explain_queue_size`
+    plans wait for the thread; samples past that are dropped.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        maxsize: int,
+        sample_rate: float = 0.0,
+        explain_queue_size: int = 10,
+    ):
+        self.threshold_ms = threshold_ms
+        self.sample_rate = sample_rate
+        self._entries: deque[SlowQuery] = deque(maxlen=maxsize)
+        self._lock = Lock()
+        self._explainer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="slow-query-explain"
+        )
+        self._explain_slots = BoundedSemaphore(explain_queue_size)
+
+    def watch(self, engine: Engine, explain_engine: Engine | None = None):
+        """Time the statements `engine` runs.
+
+        Plans are captured through `explain_engine`, which defaults to
+        `engine` and must be a sync engine.
+        """
+        explain_engine = explain_engine or engine
+
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            if context is not None:
+                context._slow_query_started = perf_counter()
+
+        def after_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            started = getattr(context, "_slow_query_started", None)
+
+            if started is None or not context.execution_options.get(
+                "slow_query_log", True
+            ):
+                return
+
+            duration_ms = (perf_counter() - started) * 1000
+
+            if duration_ms >= self.threshold_ms:
+                self._record(
+                    explain_engine,
+                    statement,
+                    parameters,
+                    executemany,
+                    duration_ms,
+                )
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+    def _record(
+        self,
+        explain_engine: Engine,
+        statement: str,
+        parameters,
+        executemany: bool,
+        duration_ms: float,
+    ) -> None:
+        batch = list(parameters) if executemany else [parameters]
+        first = batch[0] if batch else {}
+        request = current_request()
+        entry = SlowQuery(
+            at=datetime.now(timezone.utc),
+            duration_ms=duration_ms,
+            statement=normalize_sql(statement),
+            parameters=parameter_shapes(first or {}),
+            batch_size=len(batch),
+            route=request.route if request else None,
+            user_id=request.user_id if request else None,
+        )
+
+        with self._lock:
+            self._entries.append(entry)
+
+        logger.warning(
+            "Slow query (%.1f ms) on %s for user %s: %s",
+            duration_ms,
+            entry.route or "no route",
+            entry.user_id,
+            entry.statement,
+        )
+
+        if (
+            self.sample_rate
+            and random() < self.sample_rate
+            and self._explain_slots.acquire(blocking=False)
+        ):
+            future = self._explainer.submit(
+                self._explain, entry, explain_engine, statement, first
+            )
+            future.add_done_callback(lambda _: self._explain_slots.release())
+
+    def _explain(
+        self, entry: SlowQuery, engine: Engine, statement: str, parameters
+    ) -> None:
+        analyze = statement.lstrip()[:6].upper() == "SELECT" and not (
+            _LOCKING_CLAUSE.search(statement)
+        )
+        options = "ANALYZE, BUFFERS" if analyze else "COSTS"
+
+        try:
+            # Rolled back on exit, and kept out of the log itself.
+            with engine.connect() as conn:
+                rows = conn.execution_options(
+                    slow_query_log=False
+                ).exec_driver_sql(
+                    f"EXPLAIN ({options}) {statement}", parameters or {}
+                )
+                entry.plan = "\n".join(row[0] for row in rows)
+        except Exception:
+            logger.exception("Could not explain a slow query")
+
+    def wait_for_plans(self) -> None:
+        """Block until the plans sampled so far are captured."""
+        self._explainer.submit(lambda: None).result()
+
+    def entries(self) -> list[SlowQuery]:
+        """The logged statements, newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    maxsize=settings.SLOW_QUERY_LOG_SIZE,
+    sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    explain_queue_size=settings.SLOW_QUERY_EXPLAIN_QUEUE_SIZE,
+)
@@ -0,0 +1,54 @@
+"""Per-user data version, bumped by every write to a user's data."""
+
+from sqlalchemy import CTE, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.user_data_version import UserDataVersion
+
+
+def bump_data_version(session: Session, user_id: int) -> None:
+    """Bump the user's version in the caller's transaction."""
+    session.execute(
+        insert(UserDataVersion)
+        .values(id_user_fk=user_id, version=1)
+        .on_conflict_do_update(
+            index_elements=[UserDataVersion.id_user_fk],
+            set_={"version": UserDataVersion.version + 1},
+        )
+    )
+
+
+def bump_data_version_after(user_id: int, written: CTE) -> CTE:
+    """Bump the user's version in the statement that writes `written`.
+
+    The bump only happens when `written` returned a row, so a write that
+    matched nothing leaves the version, and the user's ETags, alone.
+    """
+    return (
+        insert(UserDataVersion)
+        .from_select(
+            ["id_user_fk", "version"],
+            select(literal(user_id), literal(1)).select_from(written).limit(1),
+        )
+        .on_conflict_do_update(
+            index_elements=[UserDataVersion.id_user_fk],
+            set_={"version": UserDataVersion.version + 1},
+        )
+        .cte("bumped_version")
+    )
+
+
+def _version_query(user_id: int):
+    return select(UserDataVersion.version).where(
+        UserDataVersion.id_user_fk == user_id
+    )
+
+
+def get_data_version(session: Session, user_id: int) -> int:
+    return session.scalar(_version_query(user_id)) or 0
+
+
+async def get_data_version_async(session: AsyncSession, user_id: int) -> int:
+    return await session.scalar(_version_query(user_id)) or 0
@@ -0,0 +1,204 @@
+"""Compare the ledger engine's routes with hand-written ones.
+
+The baseline routes below are what `app/modules/income/routers.py`
+looked like before the engine: plain module-level handlers for one
+model, with the same ETag and cache dependencies. Both are served in
+the same process, against the same rows, so any gap is the engine's
+own per-request overhead.
+
+It creates its tables in `BENCHMARK_DATABASE_URL` and drops them after,
+so point it at a scratch database:
+
+    BENCHMARK_DATABASE_URL=postgresql+psycopg://... \
+        python -m benchmarks.ledger
+"""
+
+import os
+import sys
+from http import HTTPStatus
+from math import ceil
+from time import perf_counter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.database import get_session
+from app.models.base import table_registry
+from app.models.income import Income
+from app.models.member import Member
+from app.models.user import User
+from app.modules.income.routers import router as ledger_income_router
+from app.modules.income.schemas import (
+    IncomePaginated,
+    IncomePublic,
+    IncomeSchema,
+)
+from app.security import TokenUser, get_token_user
+from app.shared.etag import check_etag
+from app.shared.listing import rows_with_member, select_with_member
+from app.shared.pagination import IncludeTotal, count_total
+from app.shared.response_cache import CachingRoute, use_response_cache
+from app.shared.responses import model_response
+
+ROWS = 1000
+REQUESTS = 200
+ROUNDS = 10
+
+T_Session = Annotated[Session, Depends(get_session)]
+T_CurrentUser = Annotated[TokenUser, Depends(get_token_user)]
+
+baseline_router = APIRouter(
+    prefix="/baseline/incomes", route_class=CachingRoute
+)
+
+
+@baseline_router.get(
+    "/",
+    response_model=IncomePaginated,
+    dependencies=[Depends(check_etag), Depends(use_response_cache)],
+)
+def get_incomes_paginated(
+    session: T_Session,
+    current_user: T_CurrentUser,
+    response: Response,
+    page: int = 1,
+    per_page: int = 10,
+):
+    query = select_with_member(Income, IncomePublic).filter(
+        Income.id_user_fk == current_user.id
+    )
+    total = count_total(session, query, IncludeTotal.EXACT)
+    items = rows_with_member(
+        session.execute(
+            query.order_by(Income.updated_at.desc(), Income.id.desc())
+            .limit(per_page)
+            .offset((page - 1) * per_page)
+        )
+    )
+
+    return model_response(
+        IncomePaginated,
+        response,
+        {
+            "items": items,
+            "pagination": {
+                "count": len(items),
+                "page": page,
+                "per_page": per_page,
+                "total": total,
+                "total_pages": ceil(total / per_page) if total else 1,
+            },
+        },
+    )
+
+
+@baseline_router.get(
+    "/{income_id}",
+    response_model=IncomeSchema,
+    dependencies=[Depends(check_etag)],
+)
+def get_income(
+    income_id: int, session: T_Session, current_user: T_CurrentUser
+):
+    income = session.execute(
+        select(Income)
+        .filter(Income.id == income_id)
+        .filter(Income.id_user_fk == current_user.id)
+    ).scalar()
+
+    if not income:
+        raise HTTPException(
+            status_code=HTTPStatus.NOT_FOUND, detail="Income not found"
+        )
+
+    return income
+
+
+def _seed(session: Session) -> User:
+    user = User(
+        name="bench", username="bench", email="bench@x.com", password="x"
+    )
+    session.add(user)
+    session.flush()
+    member = Member(name="bench", id_user_fk=user.id)
+    session.add(member)
+    session.flush()
+    session.add_all(
+        Income(
+            name=f"Income {index}",
+            amount=100,
+            id_user_fk=user.id,
+            id_member_fk=member.id,
+            member=member,
+        )
+        for index in range(ROWS)
+    )
+    session.commit()
+
+    return user
+
+
+def _compare(client: TestClient, *urls: str) -> list[float]:
+    """Best per-request time in ms for each url, rounds interleaved."""
+    best = [float("inf")] * len(urls)
+
+    for _ in range(ROUNDS):
+        for index, url in enumerate(urls):
+            started = perf_counter()
+
+            for _ in range(REQUESTS):
+                client.get(url)
+
+            elapsed = (perf_counter() - started) / REQUESTS * 1000
+            best[index] = min(best[index], elapsed)
+
+    return best
+
+
+def main():
+    url = os.environ.get("BENCHMARK_DATABASE_URL")
+
+    if not url:
+        sys.exit("Set BENCHMARK_DATABASE_URL to a scratch database.")
+
+    engine = create_engine(url)
+    table_registry.metadata.create_all(engine)
+
+    try:
+        with Session(engine, expire_on_commit=False) as session:
+            user = _seed(session)
+            income_id = session.scalar(select(Income.id).limit(1))
+
+        def session_override():
+            with Session(engine) as session:
+                yield session
+
+        app = FastAPI()
+        app.include_router(ledger_income_router)
+        app.include_router(baseline_router)
+        app.dependency_overrides[get_session] = session_override
+        app.dependency_overrides[get_token_user] = lambda: TokenUser(
+            id=user.id, username=user.username
+        )
+
+        with TestClient(app) as client:
+            for name, path in (
+                ("list", "/?per_page=50"),
+                ("detail", f"/{income_id}"),
+            ):
+                baseline, ledger = _compare(
+                    client, f"/baseline/incomes{path}", f"/incomes{path}"
+                )
+                print(
+                    f"{name:>7}: baseline {baseline:6.2f} ms, "
+                    f"ledger {ledger:6.2f} ms per request"
+                )
+    finally:
+        table_registry.metadata.drop_all(engine)
+
+
+if __name__ == "__main__":
+    main()
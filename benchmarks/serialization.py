@@ -0,0 +1,84 @@
+"""Time how long a 1k-item income page takes to become a JSON body.
+
+Compares FastAPI's default path for a `response_model` (validate, dump
+to Python objects, encode with `json`) with `model_response`.
+
+Run it with `python -m benchmarks.serialization`.
+"""
+
+import asyncio
+from datetime import datetime
+from timeit import repeat
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.modules.income.schemas import IncomePaginated
+from app.shared.responses import model_response
+
+ITEMS = 1000
+ROUNDS = 50
+
+
+def _page() -> dict:
+    now = datetime(2024, 1, 1)
+    member = SimpleNamespace(id=1, name="Member")
+    items = [
+        SimpleNamespace(
+            id=index,
+            name=f"Income {index}",
+            amount=1234.56,
+            id_user_fk=1,
+            member=member,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(ITEMS)
+    ]
+
+    return {
+        "items": items,
+        "pagination": {
+            "count": ITEMS,
+            "page": 1,
+            "per_page": ITEMS,
+            "total": ITEMS,
+            "total_pages": 1,
+        },
+    }
+
+
+def default_path(field, page: dict) -> bytes:
+    content = asyncio.run(
+        serialize_response(
+            field=field, response_content=page, is_coroutine=False
+        )
+    )
+
+    return JSONResponse(content).body
+
+
+def fast_path(page: dict) -> bytes:
+    return model_response(IncomePaginated, JSONResponse(None), page).body
+
+
+def main():
+    page = _page()
+    field = create_model_field(
+        "response", IncomePaginated, mode="serialization"
+    )
+
+    assert default_path(field, page) == fast_path(page)
+
+    for name, run in (
+        ("default", lambda: default_path(field, page)),
+        ("model_response", lambda: fast_path(page)),
+    ):
+        best = min(repeat(run, number=1, repeat=ROUNDS))
+        print(f"{name:>15}: {best * 1000:7.2f} ms per {ITEMS}-item page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+"""Load the hot endpoints with a seeded database and report their latency.
+
+Seeds `--users` users, each with `--members` members, `--lines` incomes,
+essential and non essential expenses, and `--months` months already
+rolled over. It then sends each scenario's requests from `--concurrency`
+clients and reports throughput and p50/p90/p99 latency per scenario as
+JSON, so runs on different commits can be compared:
+
+    python -m benchmarks.suite --output before.json
+    git checkout other-branch
+    python -m benchmarks.suite --output after.json --compare before.json
+
+The database is `BENCHMARK_DATABASE_URL` when set, or a throwaway
+Postgres container like the one the tests use. The tables are created
+and dropped by the run, so never point it at a database you need.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from math import ceil
+from statistics import fmean
+from threading import local
+from time import perf_counter
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from app.database import get_session
+from app.main import app
+from app.models.base import table_registry
+from app.models.essential_expense import EssentialExpense
+from app.models.income import Income
+from app.models.member import Member
+from app.models.month import Month
+from app.models.non_essential_expense import NonEssentialExpense
+from app.models.user import User
+from app.modules.month.rollover import rollover_month
+from app.modules.report.rollup import refresh_rollup
+from app.security import (
+    create_access_token,
+    get_password_hash,
+    require_admin,
+    user_claims,
+)
+from app.shared.instrumentation import instrument_engine
+from app.shared.slow_queries import slow_query_log
+
+PASSWORD = "benchmark"
+
+
+@dataclass
+class Scenario:
+    name: str
+    requests: int
+    call: Callable[[TestClient, int], object]
+
+
+@dataclass
+class Seed:
+    usernames: list[str]
+    tokens: list[str]
+    members: list[int]
+    incomes: list[int]
+    months: list[int]
+    fresh_months: list[int]
+
+
+@contextmanager
+def database_url():
+    url = os.environ.get("BENCHMARK_DATABASE_URL")
+
+    if url:
+        yield url
+        return
+
+    from testcontainers.postgres import PostgresContainer
+
+    with PostgresContainer("postgres:16", driver="psycopg") as postgres:
+        yield postgres.get_connection_url()
+
+
+def seed(engine, args) -> Seed:
+    """Insert the benchmark's rows with multi-row INSERTs."""
+    password = get_password_hash(PASSWORD)
+
+    with Session(engine) as session:
+        user_ids = session.scalars(
+            insert(User).returning(User.id, sort_by_parameter_order=True),
+            [
+                {
+                    "name": f"Bench {index}",
+                    "username": f"bench{index}",
+                    "email": f"bench{index}@bench.com",
+                    "password": password,
+                }
+                for index in range(args.users)
+            ],
+        ).all()
+        member_ids = session.scalars(
+            insert(Member).returning(Member.id, sort_by_parameter_order=True),
+            [
+                {"name": f"Member {index}", "id_user_fk": user_id}
+                for user_id in user_ids
+                for index in range(args.members)
+            ],
+        ).all()
+        first_members = member_ids[:: args.members]
+        first_incomes = []
+
+        for model, value in (
+            (Income, "amount"),
+            (EssentialExpense, "expected"),
+            (NonEssentialExpense, "expected"),
+        ):
+            ids = session.scalars(
+                insert(model).returning(
+                    model.id, sort_by_parameter_order=True
+                ),
+                [
+                    {
+                        "name": f"{model.__name__} {index}",
+                        value: 100 + index,
+                        "id_user_fk": user_id,
+                        "id_member_fk": member_ids[
+                            user_index * args.members + index % args.members
+                        ],
+                    }
+                    for user_index, user_id in enumerate(user_ids)
+                    for index in range(args.lines)
+                ],
+            ).all()
+
+            if model is Income:
+                first_incomes = ids[:: args.lines]
+
+        month_ids = session.scalars(
+            insert(Month).returning(Month.id, sort_by_parameter_order=True),
+            [
+                {"created_at": datetime(2020 + index // 12, index % 12 + 1, 1)}
+                for index in range(args.months + args.heavy_requests)
+            ],
+        ).all()
+
+        for month_id in month_ids[: args.months]:
+            rollover_month(session, month_id)
+            refresh_rollup(session, month_id)
+
+        session.commit()
+
+    usernames = [f"bench{index}" for index in range(args.users)]
+
+    return Seed(
+        usernames=usernames,
+        tokens=[
+            create_access_token(
+                data={"sub": username, **user_claims(user_id, 0)}
+            )
+            for username, user_id in zip(usernames, user_ids)
+        ],
+        members=first_members,
+        incomes=first_incomes,
+        months=month_ids[: args.months],
+        fresh_months=month_ids[args.months :],
+    )
+
+
+def scenarios(data: Seed, args) -> list[Scenario]:
+    users = len(data.tokens)
+    pages = max(1, ceil(args.lines / 20))
+
+    def auth(index: int) -> dict:
+        return {"Authorization": f"Bearer {data.tokens[index % users]}"}
+
+    def get(path: Callable[[int], str]):
+        return lambda client, index: client.get(
+            path(index), headers=auth(index)
+        )
+
+    def login(client, index):
+        return client.post(
+            "/auth/token",
+            data={
+                "username": data.usernames[index % users],
+                "password": PASSWORD,
+            },
+        )
+
+    def create_income(client, index):
+        return client.post(
+            "/incomes/",
+            headers=auth(index),
+            json={
+                "name": f"Bench income {index}",
+                "amount": 10,
+                "id_member_fk": data.members[index % users],
+            },
+        )
+
+    def update_income(client, index):
+        return client.put(
+            f"/incomes/{data.incomes[index % users]}",
+            headers=auth(index),
+            json={
+                "name": f"Bench income {index}",
+                "amount": 20,
+                "id_member_fk": data.members[index % users],
+            },
+        )
+
+    def month_rollover(client, index):
+        return client.post(
+            f"/months/{data.fresh_months[index]}/rollover",
+            headers=auth(index),
+        )
+
+    requests, heavy = args.requests, args.heavy_requests
+    month = data.months[-1] if data.months else 0
+
+    return [
+        Scenario("login", heavy, login),
+        Scenario(
+            "refresh_token",
+            requests,
+            lambda client, index: client.post(
+                "/auth/refresh_token", headers=auth(index)
+            ),
+        ),
+        Scenario(
+            "list_incomes",
+            requests,
+            get(lambda i: f"/incomes/?per_page=20&page={i % pages + 1}"),
+        ),
+        Scenario(
+            "list_incomes_by_name",
+            requests,
+            get(lambda i: "/incomes/?per_page=20&name=Income%201"),
+        ),
+        Scenario(
+            "list_incomes_by_cursor",
+            requests,
+            get(lambda i: "/incomes/?per_page=20&cursor="),
+        ),
+        Scenario(
+            "list_essential_expenses",
+            requests,
+            get(lambda i: "/essential-expenses/?per_page=20"),
+        ),
+        Scenario(
+            "list_non_essential_expenses",
+            requests,
+            get(lambda i: "/non-essential-expenses/?per_page=20"),
+        ),
+        Scenario("create_income", requests, create_income),
+        Scenario("update_income", requests, update_income),
+        Scenario(
+            "month_summary",
+            requests,
+            get(lambda i: f"/months/{month}/summary"),
+        ),
+        Scenario("yearly_report", requests, get(lambda i: "/reports/yearly")),
+        Scenario("month_rollover", heavy, month_rollover),
+        Scenario("export_csv", heavy, get(lambda i: "/exports/?format=csv")),
+    ]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of the sorted `values`."""
+    return values[max(0, ceil(fraction * len(values)) - 1)]
+
+
+def run(scenario: Scenario, concurrency: int) -> dict:
+    clients = local()
+
+    def timed(index: int) -> tuple[float, bool]:
+        if not hasattr(clients, "client"):
+            clients.client = TestClient(app)
+
+        started = perf_counter()
+        response = scenario.call(clients.client, index)
+        elapsed = perf_counter() - started
+
+        return elapsed * 1000, response.is_success
+
+    started = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed, range(scenario.requests)))
+
+    wall = perf_counter() - started
+    latencies = sorted(latency for latency, _ in results)
+
+    return {
+        "requests": scenario.requests,
+        "errors": sum(1 for _, ok in results if not ok),
+        "throughput_rps": round(scenario.requests / wall, 2),
+        "mean_ms": round(fmean(latencies), 3),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p90_ms": round(percentile(latencies, 0.90), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+        "max_ms": round(latencies[-1], 3),
+    }
+
+
+def git_revision() -> dict:
+    def git(*command: str) -> str:
+        return subprocess.run(
+            ["git", *command], capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    return {
+        "commit": git("rev-parse", "HEAD") or None,
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """Print how each scenario moved against an earlier report."""
+    print(f"\nAgainst {baseline.get('commit') or 'baseline'}:")
+
+    for name, result in report["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+
+        if not before:
+            print(f"{name:>28}: new")
+            continue
+
+        changes = [
+            f"{metric} {(result[metric] / before[metric] - 1) * 100:+.1f}%"
+            for metric in ("p50_ms", "p99_ms", "throughput_rps")
+            if before[metric]
+        ]
+        print(f"{name:>28}: " + ", ".join(changes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--members", type=int, default=3)
+    parser.add_argument("--lines", type=int, default=100)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument(
+        "--heavy-requests",
+        type=int,
+        default=10,
+        help="requests for login, month rollover and export",
+    )
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--compare", help="an earlier report to compare to")
+    args = parser.parse_args()
+
+    with database_url() as url:
+        engine = create_engine(url, pool_size=args.concurrency + 5)
+        instrument_engine(engine)
+        slow_query_log.watch(engine)
+        table_registry.metadata.create_all(engine)
+
+        def session_override():
+            with Session(engine) as session:
+                yield session
+
+        app.dependency_overrides[get_session] = session_override
+        app.dependency_overrides[require_admin] = lambda: None
+
+        try:
+            seeded = seed(engine, args)
+
+            with engine.connect() as conn:
+                server = conn.execute(text("SHOW server_version")).scalar()
+
+            results = {}
+
+            for scenario in scenarios(seeded, args):
+                results[scenario.name] = run(scenario, args.concurrency)
+                print(
+                    f"{scenario.name:>28}: "
+                    f"{results[scenario.name]['throughput_rps']:8.1f} req/s, "
+                    f"p50 {results[scenario.name]['p50_ms']:8.2f} ms, "
+                    f"p99 {results[scenario.name]['p99_ms']:8.2f} ms"
+                )
+        finally:
+            app.dependency_overrides.clear()
+            table_registry.metadata.drop_all(engine)
+            engine.dispose()
+
+    report = {
+        **git_revision(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "postgres": server,
+        "scale": {
+            "users": args.users,
+            "members": args.members,
+            "lines": args.lines,
+            "months": args.months,
+            "concurrency": args.concurrency,
+        },
+        "scenarios": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            compare(report, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
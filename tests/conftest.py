@@ -1,20 +1,40 @@
 from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 
 import factory
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
+from sqlalchemy import NullPool, create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
 from testcontainers.postgres import PostgresContainer
 
-from app.database import get_session
+from app import security
+from app.database import get_async_session, get_session
 from app.main import app
 from app.models.base import table_registry
 from app.models.income import Income
 from app.models.member import Member
 from app.models.user import User
-from app.security import get_password_hash
+from app.modules.essential_expense import async_routers as essential_async
+from app.modules.income import async_routers as income_async
+from app.modules.member import async_routers as member_async
+from app.modules.non_essential_expense import (
+    async_routers as non_essential_async,
+)
+from app.modules.user import async_routers as user_async
+from app.security import (
+    get_password_hash,
+    settings,
+    token_versions,
+    user_cache,
+    user_generations,
+)
+from app.shared.instrumentation import instrument_engine, request_metrics
+from app.shared.response_cache import response_cache
+from app.shared.slow_queries import slow_query_log
 
 # Factories ========================================
 
@@ -51,10 +71,24 @@ class IncomeFactory(factory.Factory):
 # Fixtures ========================================
 
 
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hash():
+    default_pwd_context = security.pwd_context
+    security.pwd_context = security.build_password_hash(
+        time_cost=1, memory_cost=1024, parallelism=1
+    )
+
+    yield
+
+    security.pwd_context = default_pwd_context
+
+
 @pytest.fixture(scope="session")
 def engine():
     with PostgresContainer("postgres:16", driver="psycopg") as postgres:
         _engine = create_engine(postgres.get_connection_url())
+        instrument_engine(_engine)
+        slow_query_log.watch(_engine)
 
         with _engine.begin():
             yield _engine
@@ -71,6 +105,54 @@ def client(session):
         yield client
 
     app.dependency_overrides.clear()
+    user_cache.clear()
+    user_generations.clear()
+    token_versions.clear()
+    response_cache.clear()
+    request_metrics.clear()
+    slow_query_log.clear()
+
+
+@pytest.fixture
+def async_client(engine, session):
+    """Client for an app serving the async routers ahead of the sync ones."""
+    async_engine = create_async_engine(engine.url, poolclass=NullPool)
+
+    async def get_async_session_override():
+        async with AsyncSession(
+            async_engine, expire_on_commit=False
+        ) as async_session:
+            yield async_session
+
+    def get_session_override():
+        return session
+
+    async_app = FastAPI()
+
+    for module in (
+        user_async,
+        member_async,
+        income_async,
+        essential_async,
+        non_essential_async,
+    ):
+        async_app.include_router(module.router)
+
+    for route in app.routes:
+        async_app.router.routes.append(route)
+
+    async_app.dependency_overrides[get_async_session] = (
+        get_async_session_override
+    )
+    async_app.dependency_overrides[get_session] = get_session_override
+
+    with TestClient(async_app) as client:
+        yield client
+
+    user_cache.clear()
+    user_generations.clear()
+    token_versions.clear()
+    response_cache.clear()
 
 
 @pytest.fixture
@@ -105,6 +187,42 @@ def mock_db_time():
     return _mock_db_time
 
 
+@contextmanager
+def _assert_max_queries(engine, statements, rows=None):
+    executed = []
+    fetched = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+        fetched.append(max(cursor.rowcount, 0))
+
+    event.listen(engine, "after_cursor_execute", count)
+
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "after_cursor_execute", count)
+
+    listing = "\n\n".join(executed)
+
+    assert (
+        len(executed) <= statements
+    ), f"{len(executed)} statements, budget is {statements}:\n\n{listing}"
+    assert (
+        rows is None or sum(fetched) <= rows
+    ), f"{sum(fetched)} rows, budget is {rows}:\n\n{listing}"
+
+
+@pytest.fixture
+def assert_max_queries(engine):
+    """Fail when a block runs more statements or rows than its budget.
+
+    with assert_max_queries(2, rows=10):
+        client.get("/incomes/")
+    """
+    return partial(_assert_max_queries, engine)
+
+
 # Fixtures for models ========================================
 
 
@@ -141,6 +259,13 @@ def token(client, user):
     return response.json()["access_token"]
 
 
+@pytest.fixture
+def admin_headers(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "admin")
+
+    return {"X-Admin-Token": "admin"}
+
+
 @pytest.fixture
 def member(session, user):
     member = MemberFactory(id_user_fk=user.id)
@@ -0,0 +1,93 @@
+from http import HTTPStatus
+
+
+def test_async_create_and_list_incomes(async_client, member, token):
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = async_client.post(
+        "/incomes/",
+        headers=headers,
+        json={"name": "salary", "amount": 100.0, "id_member_fk": member.id},
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()["member"] == {"id": member.id, "name": member.name}
+
+    response = async_client.get("/incomes/", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["pagination"]["total"] == 1
+    assert response.json()["items"][0]["name"] == "salary"
+
+
+def test_async_create_income_with_other_member(
+    async_client, other_member, token
+):
+    response = async_client.post(
+        "/essential-expenses/",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "name": "rent",
+            "expected": 10.0,
+            "id_member_fk": other_member.id,
+        },
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json() == {"detail": "Member not found"}
+
+
+def test_async_read_members_list(async_client, member, token):
+    response = async_client.get(
+        "/members/list", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "members": [{"id": member.id, "name": member.name}]
+    }
+
+
+def test_async_update_user(async_client, user, token):
+    response = async_client.put(
+        f"/users/{user.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "name": "test",
+            "username": "test",
+            "email": "test@example.com",
+            "password": "mynewpassword",
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "id": user.id,
+        "name": "test",
+        "username": "test",
+        "email": "test@example.com",
+    }
+
+
+def test_async_delete_user(async_client, user, token):
+    response = async_client.delete(
+        f"/users/{user.id}", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"message": "User deleted"}
+
+
+def test_async_bulk_delete_is_not_taken_for_an_id(async_client, token):
+    response = async_client.request(
+        "DELETE",
+        "/non-essential-expenses/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"ids": [1]},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "deleted": [],
+        "errors": [{"index": 0, "detail": "Non essential expense not found"}],
+    }
@@ -1,6 +1,10 @@
 from http import HTTPStatus
 
 from freezegun import freeze_time
+from sqlalchemy import event
+
+from app import security
+from app.security import build_password_hash
 
 
 def test_get_token(client, user):
@@ -101,3 +105,36 @@ def test_token_expired_dont_refresh(client, user):
         )
         assert response.status_code == HTTPStatus.UNAUTHORIZED
         assert response.json() == {"detail": "Could not validate credentials"}
+
+
+def test_token_rehashes_outdated_password(client, session, user):
+    outdated_hash = build_password_hash(
+        time_cost=2, memory_cost=1024, parallelism=1
+    ).hash(user.clean_password)
+    user.password = outdated_hash
+    session.commit()
+    username, password = user.username, user.clean_password
+    statements = []
+    bind = session.get_bind()
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement.split()[0])
+
+    event.listen(bind, "before_cursor_execute", before_cursor_execute)
+    try:
+        response = client.post(
+            "/auth/token", data={"username": username, "password": password}
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", before_cursor_execute)
+
+    assert response.status_code == HTTPStatus.OK
+    # The user is not loaded again once the new hash is committed.
+    assert statements == ["SELECT", "UPDATE"]
+
+    session.refresh(user)
+    assert user.password != outdated_hash
+    assert security.pwd_context.verify(user.clean_password, user.password)
+    assert not security.pwd_context.current_hasher.check_needs_rehash(
+        user.password
+    )
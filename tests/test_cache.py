@@ -0,0 +1,56 @@
+from app.shared.cache import LocalCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_local_cache_expires_entries():
+    clock = FakeClock()
+    cache = LocalCache(maxsize=10, ttl=5, clock=clock)
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    clock.now = 5
+    assert cache.get("key") is None
+    assert cache.stats() == {
+        "size": 0,
+        "maxsize": 10,
+        "ttl": 5,
+        "hits": 1,
+        "misses": 1,
+        "bytes": 0,
+        "max_bytes": None,
+    }
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = LocalCache(maxsize=2, ttl=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_local_cache_evicts_beyond_max_bytes():
+    cache = LocalCache(maxsize=10, ttl=5, max_bytes=10)
+
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    cache.set("c", b"123")
+    cache.set("too-big", b"12345678901")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"12345"
+    assert cache.get("too-big") is None
+    assert cache.stats()["bytes"] == 8
@@ -0,0 +1,85 @@
+from http import HTTPStatus
+
+
+def _get(client, url, token, etag=None):
+    headers = {"Authorization": f"Bearer {token}"}
+
+    if etag:
+        headers["If-None-Match"] = etag
+
+    return client.get(url, headers=headers)
+
+
+def test_list_returns_not_modified_for_current_etag(client, income, token):
+    etag = _get(client, "/incomes/", token).headers["ETag"]
+
+    response = _get(client, "/incomes/", token, etag)
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+
+def test_etag_changes_after_a_write(client, member, income, token):
+    etag = _get(client, "/incomes/", token).headers["ETag"]
+
+    client.put(
+        f"/incomes/{income.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "New", "amount": 1.0, "id_member_fk": member.id},
+    )
+    response = _get(client, "/incomes/", token, etag)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["items"][0]["name"] == "New"
+
+
+def test_etag_changes_after_a_bulk_write(client, member, token):
+    etag = _get(client, "/essential-expenses/", token).headers["ETag"]
+
+    client.post(
+        "/essential-expenses/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "items": [
+                {"name": "Rent", "expected": 1.0, "id_member_fk": member.id}
+            ]
+        },
+    )
+    response = _get(client, "/essential-expenses/", token, etag)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["pagination"]["count"] == 1
+
+
+def test_etag_depends_on_the_query(client, income, token):
+    etag = _get(client, "/incomes/?page=1", token).headers["ETag"]
+
+    response = _get(client, "/incomes/?page=2", token, etag)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_members_list_etag_changes_after_delete(client, member, token):
+    etag = _get(client, "/members/list", token).headers["ETag"]
+    assert (
+        _get(client, "/members/list", token, etag).status_code
+        == HTTPStatus.NOT_MODIFIED
+    )
+
+    client.delete(
+        f"/members/{member.id}", headers={"Authorization": f"Bearer {token}"}
+    )
+    response = _get(client, "/members/list", token, etag)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"members": []}
+
+
+def test_async_detail_returns_not_modified(async_client, income, token):
+    etag = _get(async_client, f"/incomes/{income.id}", token).headers["ETag"]
+
+    response = _get(async_client, f"/incomes/{income.id}", token, etag)
+
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
@@ -0,0 +1,49 @@
+import json
+from http import HTTPStatus
+
+
+def test_export_entries_as_csv(client, income, member, token):
+    response = client.get(
+        "/exports/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.text.splitlines() == [
+        "kind,id,name,amount,id_member_fk,member_name,created_at,updated_at",
+        f"income,{income.id},{income.name},100.00,{member.id},"
+        f"{member.name},2024-01-01T00:00:00,2024-01-01T00:00:00",
+    ]
+
+
+def test_export_entries_as_ndjson(client, income, member, token):
+    response = client.get(
+        "/exports/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"format": "ndjson"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {
+            "kind": "income",
+            "id": income.id,
+            "name": income.name,
+            "amount": 100.0,
+            "id_member_fk": member.id,
+            "member_name": member.name,
+            "created_at": "2024-01-01T00:00:00",
+            "updated_at": "2024-01-01T00:00:00",
+        }
+    ]
+
+
+def test_export_entries_is_empty_for_other_user(client, other_member, token):
+    response = client.get(
+        "/exports/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"format": "ndjson"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert not response.text
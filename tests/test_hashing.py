@@ -0,0 +1,52 @@
+from http import HTTPStatus
+from threading import Event
+
+import pytest
+from fastapi import HTTPException
+
+from app.shared.hashing import HashingExecutor
+
+
+def test_hashing_executor_runs_work():
+    executor = HashingExecutor(max_workers=1, max_queue=1)
+
+    assert executor.submit(sum, [1, 2]).result() == 3
+    assert executor.stats() == {
+        "max_workers": 1,
+        "max_queue": 1,
+        "running": 0,
+        "queue_depth": 0,
+        "rejected": 0,
+    }
+
+
+def test_hashing_executor_rejects_work_beyond_the_queue():
+    executor = HashingExecutor(max_workers=1, max_queue=1)
+    started = Event()
+    release = Event()
+
+    def block():
+        started.set()
+        release.wait()
+
+    running = executor.submit(block)
+    started.wait()
+    queued = executor.submit(release.wait)
+
+    with pytest.raises(HTTPException) as exc_info:
+        executor.submit(release.wait)
+
+    assert exc_info.value.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert executor.stats()["queue_depth"] == 1
+    assert executor.stats()["rejected"] == 1
+
+    release.set()
+    running.result()
+    queued.result()
+
+
+def test_read_hashing_stats(client):
+    response = client.get("/metrics/hashing")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["rejected"] == 0
@@ -1,33 +1,43 @@
 from datetime import datetime
 from http import HTTPStatus
 
+import pytest
+from sqlalchemy import select
+
 from app.models.income import Income
+from app.modules.income.resource import income as income_resource
+from app.modules.income.schemas import IncomeSchema
+from app.shared.ledger import create_item, delete_item, update_item
+from app.shared.schemas.bulk import MAX_BULK_ITEMS
+from tests.conftest import IncomeFactory
 
 
-def test_create_income(client, user, member, token, mock_db_time):
-    with mock_db_time(model=Income, time=datetime(2024, 1, 1)):
-        response = client.post(
-            "/incomes/",
-            headers={"Authorization": f"Bearer {token}"},
-            json={
-                "name": "test",
-                "amount": 100.0,
-                "id_member_fk": member.id,
-            },
-        )
-        assert response.status_code == HTTPStatus.CREATED
-        assert response.json() == {
+def test_create_income(client, session, user, member, token):
+    response = client.post(
+        "/incomes/",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
             "name": "test",
             "amount": 100.0,
-            "id_user_fk": user.id,
-            "id": 1,
-            "member": {
-                "id": member.id,
-                "name": member.name,
-            },
-            "created_at": "2024-01-01T00:00:00",
-            "updated_at": "2024-01-01T00:00:00",
-        }
+            "id_member_fk": member.id,
+        },
+    )
+
+    income = session.scalar(select(Income))
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json() == {
+        "name": "test",
+        "amount": 100.0,
+        "id_user_fk": user.id,
+        "id": income.id,
+        "member": {
+            "id": member.id,
+            "name": member.name,
+        },
+        "created_at": income.created_at.isoformat(),
+        "updated_at": income.updated_at.isoformat(),
+    }
 
 
 def test_read_incomes_paginated(client, token):
@@ -108,3 +118,247 @@ def test_update_income(client, income, member, token):
         "created_at": income.created_at.isoformat(),
         "updated_at": income.updated_at.isoformat(),
     }
+
+
+def test_read_incomes_by_cursor(client, session, user, member, token):
+    session.add_all(
+        [
+            IncomeFactory(
+                id_user_fk=user.id, id_member_fk=member.id, member=member
+            )
+            for _ in range(3)
+        ]
+    )
+    session.commit()
+
+    response = client.get(
+        "/incomes/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"cursor": "", "per_page": 2},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    first_page = response.json()
+    assert first_page["pagination"]["count"] == 2
+    assert first_page["pagination"]["next_cursor"]
+
+    response = client.get(
+        "/incomes/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={
+            "cursor": first_page["pagination"]["next_cursor"],
+            "per_page": 2,
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    second_page = response.json()
+    assert second_page["pagination"] == {
+        "count": 1,
+        "per_page": 2,
+        "next_cursor": None,
+        "total": None,
+    }
+
+    ids = [item["id"] for item in first_page["items"] + second_page["items"]]
+    assert ids == [3, 2, 1]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"per_page": 0},
+        {"per_page": -1},
+        {"per_page": 101},
+        {"per_page": 0, "cursor": ""},
+        {"page": 0},
+    ],
+)
+def test_read_incomes_with_invalid_page(client, token, params):
+    response = client.get(
+        "/incomes/",
+        headers={"Authorization": f"Bearer {token}"},
+        params=params,
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_read_incomes_without_member(client, session, user, token):
+    session.add(
+        IncomeFactory(id_user_fk=user.id, id_member_fk=None, member=None)
+    )
+    session.commit()
+
+    response = client.get(
+        "/incomes/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["items"][0]["member"] is None
+
+
+def test_read_incomes_by_invalid_cursor(client, token):
+    response = client.get(
+        "/incomes/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"cursor": "invalid"},
+    )
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {"detail": "Invalid cursor"}
+
+
+def test_read_incomes_without_total(client, income, token):
+    response = client.get(
+        "/incomes/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"include_total": "false"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["pagination"] == {
+        "count": 1,
+        "page": 1,
+        "per_page": 10,
+        "total": None,
+        "total_pages": None,
+    }
+
+
+def test_read_incomes_with_estimated_total(client, income, token):
+    response = client.get(
+        "/incomes/",
+        headers={"Authorization": f"Bearer {token}"},
+        params={"include_total": "estimate", "name": "income"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["pagination"]["total"] >= 0
+
+
+def test_bulk_create_incomes(client, member, other_member, token):
+    response = client.post(
+        "/incomes/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "items": [
+                {"name": "a", "amount": 1.0, "id_member_fk": member.id},
+                {"name": "b", "amount": 2.0, "id_member_fk": other_member.id},
+                {"name": "c", "amount": 3.0, "id_member_fk": member.id},
+            ]
+        },
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    data = response.json()
+    assert [item["name"] for item in data["items"]] == ["a", "c"]
+    assert data["items"][0]["member"] == {
+        "id": member.id,
+        "name": member.name,
+    }
+    assert data["errors"] == [{"index": 1, "detail": "Member not found"}]
+
+
+def test_bulk_create_incomes_over_the_limit(client, member, token):
+    item = {"name": "a", "amount": 1.0, "id_member_fk": member.id}
+
+    response = client.post(
+        "/incomes/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"items": [item] * (MAX_BULK_ITEMS + 1)},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_bulk_update_incomes(client, income, member, token):
+    response = client.put(
+        "/incomes/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={
+            "items": [
+                {
+                    "id": income.id,
+                    "name": "updated",
+                    "amount": 50.0,
+                    "id_member_fk": member.id,
+                },
+                {
+                    "id": income.id + 1,
+                    "name": "missing",
+                    "amount": 50.0,
+                    "id_member_fk": member.id,
+                },
+            ]
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["items"][0]["name"] == "updated"
+    assert data["items"][0]["amount"] == 50.0
+    assert data["items"][0]["updated_at"] != "2024-01-01T00:00:00"
+    assert data["errors"] == [{"index": 1, "detail": "Income not found"}]
+
+
+def test_bulk_delete_incomes(client, income, token):
+    income_id = income.id
+
+    response = client.request(
+        "DELETE",
+        "/incomes/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"ids": [income_id, income_id + 1]},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "deleted": [income_id],
+        "errors": [{"index": 1, "detail": "Income not found"}],
+    }
+
+
+def test_bulk_delete_incomes_with_repeated_ids(client, income, token):
+    income_id = income.id
+
+    response = client.request(
+        "DELETE",
+        "/incomes/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"ids": [income_id, income_id]},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"deleted": [income_id], "errors": []}
+
+
+def test_update_income_with_other_users_member(
+    client, income, other_member, token
+):
+    response = client.put(
+        f"/incomes/{income.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "test", "amount": 1.0, "id_member_fk": other_member.id},
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json() == {"detail": "Member not found"}
+
+
+def test_income_writes_are_one_statement(
+    session, user, member, assert_max_queries
+):
+    # Detach the user so the commits do not expire and reload it.
+    session.refresh(user)
+    session.expunge(user)
+    item = IncomeSchema(name="test", amount=1.0, id_member_fk=member.id)
+
+    with assert_max_queries(1):
+        created = create_item(income_resource, session, user, item)
+
+    with assert_max_queries(1):
+        update_item(income_resource, session, user, created["id"], item)
+
+    with assert_max_queries(1):
+        delete_item(income_resource, session, user, created["id"])
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import selectinload
+
+from app.models.essential_expense import EssentialExpense
+from app.models.income import Income
+from app.models.non_essential_expense import NonEssentialExpense
+from app.modules.essential_expense.schemas import EssentialExpensePublic
+from app.modules.income.schemas import IncomePublic
+from app.modules.non_essential_expense.schemas import NonEssentialExpensePublic
+from app.shared.listing import select_with_member
+
+
+def _explain(session, query):
+    """EXPLAIN `query` with sequential scans and sorts priced out.
+
+    The test tables are nearly empty, so the planner would rather scan
+    them; disabling the alternatives shows whether an index can serve
+    the query at all.
+    """
+    compiled = query.compile(dialect=session.get_bind().dialect)
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    session.execute(text("SET LOCAL enable_sort = off"))
+    plan = session.connection().exec_driver_sql(
+        f"EXPLAIN {compiled}", compiled.params
+    )
+
+    return "\n".join(plan.scalars())
+
+
+@pytest.mark.parametrize(
+    ("model", "schema"),
+    [
+        (Income, IncomePublic),
+        (EssentialExpense, EssentialExpensePublic),
+        (NonEssentialExpense, NonEssentialExpensePublic),
+    ],
+)
+def test_list_query_uses_user_index(session, model, schema):
+    query = (
+        select_with_member(model, schema)
+        .filter(model.id_user_fk == 1)
+        .order_by(model.updated_at.desc(), model.id.desc())
+        .limit(10)
+    )
+
+    plan = _explain(session, query)
+
+    assert f"Index Scan using ix_{model.__tablename__}_id_user_fk" in plan
+    assert "Seq Scan" not in plan
+
+
+@pytest.mark.parametrize(
+    "model", [Income, EssentialExpense, NonEssentialExpense]
+)
+def test_name_filter_uses_trigram_index(session, model):
+    query = (
+        select(model)
+        .options(selectinload(model.member))
+        .filter(model.name.ilike("%market%"))
+    )
+
+    plan = _explain(session, query)
+
+    assert f"Bitmap Index Scan on ix_{model.__tablename__}_name_trgm" in plan
+    assert "Seq Scan" not in plan
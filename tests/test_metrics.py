@@ -0,0 +1,227 @@
+import re
+from datetime import datetime
+from http import HTTPStatus
+from threading import Event
+from time import sleep
+
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from app.database import (
+    InstrumentedNullPool,
+    InstrumentedQueuePool,
+    engine_options,
+    pool_status,
+)
+from app.security import settings
+from app.settings import Settings
+from app.shared.instrumentation import (
+    InstrumentationMiddleware,
+    RequestMetrics,
+)
+from app.shared.slow_queries import (
+    SlowQuery,
+    SlowQueryLog,
+    normalize_sql,
+    slow_query_log,
+)
+
+
+def test_read_user_cache_stats(client, token):
+    client.post(
+        "/auth/refresh_token", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    response = client.get("/metrics/user-cache")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["misses"] == 1
+
+
+def test_read_pool_status(client):
+    response = client.get("/metrics/pool")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["sync"]["pool"] == "InstrumentedQueuePool"
+    assert response.json()["async"]["pool"] == "InstrumentedAsyncQueuePool"
+
+
+def test_pool_status_counts_checkouts(engine):
+    pooled_engine = create_engine(
+        engine.url, poolclass=InstrumentedQueuePool, pool_size=1
+    )
+
+    with pooled_engine.connect():
+        status = pool_status(pooled_engine.pool)
+
+    assert status["checked_out"] == 1
+    assert status["checkouts"] == 1
+    assert pool_status(pooled_engine.pool)["idle"] == 1
+
+    pooled_engine.dispose()
+
+
+def test_engine_options_with_null_pool(engine):
+    settings = Settings(DATABASE_NULL_POOL=True)
+
+    options = engine_options(settings, InstrumentedQueuePool)
+
+    assert options["poolclass"] is InstrumentedNullPool
+    assert "pool_size" not in options
+    assert options["connect_args"] == {"prepare_threshold": None}
+
+    null_pool_engine = create_engine(engine.url, **options)
+
+    with null_pool_engine.connect() as conn:
+        assert conn.connection.driver_connection.prepare_threshold is None
+
+    status = pool_status(null_pool_engine.pool)
+    assert status["pool"] == "InstrumentedNullPool"
+    assert status["checkouts"] == 1
+    assert status["wait_seconds_total"] > 0
+    assert "size" not in status
+
+    null_pool_engine.dispose()
+
+
+def test_server_timing_reports_database_statements(client, token):
+    response = client.get(
+        "/incomes/", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    db, app = response.headers["Server-Timing"].split(", ")
+    statements = re.fullmatch(
+        r'db;dur=[\d.]+;desc="(\d+) statements/\d+ rows"', db
+    ).group(1)
+
+    assert int(statements) > 0
+    assert re.fullmatch(r"app;dur=[\d.]+", app)
+
+
+def test_read_request_metrics(client, token):
+    client.get("/incomes/", headers={"Authorization": f"Bearer {token}"})
+
+    response = client.get("/metrics")
+    text = response.text
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_requests_total{method="GET",route="/incomes/",status="200"} 1'
+        in text
+    )
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/incomes/"} 1'
+        in text
+    )
+    assert (
+        'http_request_db_statements_bucket{method="GET",route="/incomes/",'
+        'le="0"} 0' in text
+    )
+
+
+def test_request_metrics_leave_out_background_tasks():
+    metrics = RequestMetrics()
+    app = FastAPI()
+    app.add_middleware(InstrumentationMiddleware, metrics=metrics)
+
+    @app.post("/jobs")
+    def start_job(background_tasks: BackgroundTasks):
+        background_tasks.add_task(sleep, 0.5)
+
+    TestClient(app).post("/jobs")
+
+    assert metrics._routes["POST", "/jobs"].latency.sum < 0.5
+
+
+def test_normalize_sql():
+    statement = """SELECT income.id FROM income
+        WHERE income.id IN (%(id_1_1)s, %(id_1_2)s) AND name = 'x'
+        LIMIT 10"""
+
+    assert normalize_sql(statement) == (
+        "SELECT income.id FROM income WHERE income.id IN (%(...)s) "
+        "AND name = ? LIMIT ?"
+    )
+
+
+def test_read_slow_queries_with_plans(client, user, token, monkeypatch):
+    monkeypatch.setattr(slow_query_log, "threshold_ms", 0)
+    monkeypatch.setattr(slow_query_log, "sample_rate", 1)
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "admin")
+
+    client.get(
+        "/incomes/?name=rent", headers={"Authorization": f"Bearer {token}"}
+    )
+    slow_query_log.wait_for_plans()
+
+    response = client.get(
+        "/metrics/slow-queries", headers={"X-Admin-Token": "admin"}
+    )
+    name_filters = [
+        entry
+        for entry in response.json()
+        if "ILIKE" in entry["statement"] and "LIMIT" in entry["statement"]
+    ]
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(name_filters) == 1
+    assert name_filters[0]["route"] == "/incomes/"
+    assert name_filters[0]["user_id"] == user.id
+    assert name_filters[0]["parameters"]["name_1"] == "str"
+    assert "actual time" in name_filters[0]["plan"]
+
+
+def test_explain_skips_analyze_for_locking_selects(session, engine):
+    statement = 'SELECT "user".id FROM "user" FOR NO KEY UPDATE'
+    entry = SlowQuery(
+        at=datetime.now(),
+        duration_ms=1,
+        statement=statement,
+        parameters={},
+        batch_size=1,
+        route=None,
+        user_id=None,
+    )
+
+    slow_query_log._explain(entry, engine, statement, {})
+
+    assert "LockRows" in entry.plan
+    assert "actual time" not in entry.plan
+
+
+def test_slow_query_log_drops_plans_past_the_queue(engine, monkeypatch):
+    log = SlowQueryLog(
+        threshold_ms=0, maxsize=10, sample_rate=1, explain_queue_size=1
+    )
+    explained = []
+    release = Event()
+
+    def explain(entry, *args):
+        release.wait()
+        explained.append(entry)
+
+    monkeypatch.setattr(log, "_explain", explain)
+
+    log._record(engine, "SELECT 1", {}, False, 1)
+    log._record(engine, "SELECT 2", {}, False, 1)
+    release.set()
+    log.wait_for_plans()
+
+    assert len(log.entries()) == 2
+    assert len(explained) == 1
+
+
+def test_read_slow_queries_requires_admin_token(client, monkeypatch):
+    response = client.get("/metrics/slow-queries")
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "admin")
+    response = client.get(
+        "/metrics/slow-queries", headers={"X-Admin-Token": "wrong"}
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json() == {"detail": "Not enough permissions"}
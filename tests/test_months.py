@@ -1,11 +1,310 @@
+from datetime import datetime
 from http import HTTPStatus
 
+from sqlalchemy import func, select, update
 
-def test_create_month(client, user):
+from app.models.essential_expense import EssentialExpense
+from app.models.income import Income
+from app.models.month import Month
+from app.models.month_essential_expense import MonthEssentialExpense
+from app.models.month_income import MonthIncome
+from app.models.month_rollover import MonthRollover
+from app.models.user_month import UserMonth
+from app.modules.month.jobs import (
+    run_rollover,
+    run_rollover_chunk,
+    start_rollover,
+)
+
+
+def test_create_month(client, user, admin_headers):
     date = "2024-12-01T00:00:01"
     response = client.post(
         "/months/",
+        headers=admin_headers,
         json={"created_at": date},
     )
-    assert response.status_code == HTTPStatus.CREATED
+    assert response.status_code == HTTPStatus.ACCEPTED
     assert response.json() == {"id": 1, "created_at": date}
+
+
+def test_read_month_status(client, user, admin_headers):
+    response = client.post(
+        "/months/",
+        headers=admin_headers,
+        json={"created_at": "2024-12-01T00:00:01"},
+    )
+    month_id = response.json()["id"]
+
+    response = client.get(f"/months/{month_id}/status")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["status"] == "done"
+    assert response.json()["total_users"] == 1
+    assert response.json()["processed_users"] == 1
+    assert response.json()["last_user_id"] == user.id
+    assert response.json()["inserted"] == 1
+    assert response.json()["skipped"] == 0
+    assert response.json()["finished_at"] is not None
+
+
+def test_read_month_status_not_found(client):
+    response = client.get("/months/999/status")
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {"detail": "Month not found"}
+
+
+def test_rollover_resumes_from_last_chunk(session, user, other_user):
+    month = Month(created_at=datetime(2024, 12, 1))
+    session.add(month)
+    session.flush()
+    start_rollover(session, month.id)
+    session.commit()
+    bind = session.get_bind()
+
+    assert run_rollover_chunk(bind, month.id, chunk_size=1)
+
+    job = session.get(MonthRollover, month.id)
+    assert job.status == "running"
+    assert job.processed_users == 1
+    assert job.last_user_id == user.id
+
+    run_rollover(bind, month.id, chunk_size=1)
+
+    session.refresh(job)
+    assert job.status == "done"
+    assert job.processed_users == 2
+    assert (
+        session.scalar(
+            select(func.count()).where(UserMonth.id_month_fk == month.id)
+        )
+        == 2
+    )
+
+
+def test_create_month_snapshots_templates(
+    client, session, user, income, admin_headers
+):
+    response = client.post(
+        "/months/",
+        headers=admin_headers,
+        json={"created_at": "2024-12-01T00:00:01"},
+    )
+    month_id = response.json()["id"]
+
+    assert (
+        session.scalar(
+            select(func.count()).where(UserMonth.id_month_fk == month_id)
+        )
+        == 1
+    )
+    snapshot = session.scalar(
+        select(MonthIncome).where(MonthIncome.id_month_fk == month_id)
+    )
+    assert snapshot.id_income_fk == income.id
+    assert snapshot.amount == income.amount
+
+
+def test_rollover_month_runs_again_as_a_job(
+    client, session, user, income, admin_headers
+):
+    response = client.post(
+        "/months/",
+        headers=admin_headers,
+        json={"created_at": "2024-12-01T00:00:01"},
+    )
+    month_id = response.json()["id"]
+
+    response = client.post(
+        f"/months/{month_id}/rollover", headers=admin_headers
+    )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    assert response.json()["status"] == "pending"
+    assert response.json()["processed_users"] == 0
+
+    job = session.get(MonthRollover, month_id)
+    session.refresh(job)
+    assert job.status == "done"
+    assert job.processed_users == 1
+    # The user's month link and income were written by POST /months/.
+    assert (job.inserted, job.skipped) == (0, 2)
+    assert (
+        session.scalar(
+            select(func.count()).where(MonthIncome.id_month_fk == month_id)
+        )
+        == 1
+    )
+
+
+def test_rollover_month_in_progress(client, session, user, admin_headers):
+    month = Month(created_at=datetime(2024, 12, 1))
+    session.add(month)
+    session.flush()
+    start_rollover(session, month.id)
+    session.commit()
+
+    response = client.post(
+        f"/months/{month.id}/rollover", headers=admin_headers
+    )
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json() == {"detail": "Rollover already in progress"}
+
+
+def test_rollover_month_reclaims_stale_job(
+    client, session, user, admin_headers
+):
+    month = Month(created_at=datetime(2024, 12, 1))
+    session.add(month)
+    session.flush()
+    job = start_rollover(session, month.id)
+    session.flush()
+    job.status = "running"
+    job.updated_at = datetime(2024, 12, 1)
+    session.commit()
+
+    response = client.post(
+        f"/months/{month.id}/rollover", headers=admin_headers
+    )
+
+    assert response.status_code == HTTPStatus.ACCEPTED
+    session.refresh(job)
+    assert job.status == "done"
+
+
+def test_create_month_requires_admin_token(client, user):
+    response = client.post(
+        "/months/", json={"created_at": "2024-12-01T00:00:01"}
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+def test_rollover_month_requires_admin_token(client, user):
+    response = client.post("/months/1/rollover")
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+
+def test_rollover_month_not_found(client, admin_headers):
+    response = client.post("/months/999/rollover", headers=admin_headers)
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {"detail": "Month not found"}
+
+
+def test_read_month_summary(
+    client, session, user, other_user, member, income, token, admin_headers
+):
+    session.add_all(
+        [
+            EssentialExpense(
+                id_user_fk=user.id,
+                id_member_fk=member.id,
+                name="Rent",
+                expected=100,
+                member=member,
+            ),
+            Income(
+                id_user_fk=other_user.id,
+                id_member_fk=None,
+                name="Salary",
+                amount=999,
+                member=None,
+            ),
+        ]
+    )
+    session.commit()
+    response = client.post(
+        "/months/",
+        headers=admin_headers,
+        json={"created_at": "2024-12-01T00:00:01"},
+    )
+    month_id = response.json()["id"]
+    session.execute(
+        update(MonthEssentialExpense)
+        .where(MonthEssentialExpense.id_month_fk == month_id)
+        .values(paid=40)
+    )
+    session.commit()
+
+    response = client.get(
+        f"/months/{month_id}/summary",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    totals = {
+        "income": float(income.amount),
+        "essential_expected": 100.0,
+        "essential_paid": 40.0,
+        "non_essential_expected": 0.0,
+        "non_essential_paid": 0.0,
+        "balance": float(income.amount) - 100,
+    }
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "id_month_fk": month_id,
+        **totals,
+        "members": [
+            {**totals, "member": {"id": member.id, "name": member.name}}
+        ],
+    }
+
+
+def test_read_month_summary_not_found(client, token):
+    response = client.get(
+        "/months/999/summary", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json() == {"detail": "Month not found"}
+
+
+def test_deleting_a_line_keeps_the_month(
+    client, session, user, income, token, admin_headers
+):
+    headers = {"Authorization": f"Bearer {token}"}
+    income_id, name, amount = income.id, income.name, float(income.amount)
+    response = client.post(
+        "/months/",
+        headers=admin_headers,
+        json={"created_at": "2024-12-01T00:00:01"},
+    )
+    month_id = response.json()["id"]
+
+    response = client.delete(f"/incomes/{income_id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    snapshot = session.scalar(select(MonthIncome))
+    assert snapshot.id_income_fk == income_id
+    assert snapshot.name == name
+    assert (
+        client.get(f"/months/{month_id}/summary", headers=headers).json()[
+            "income"
+        ]
+        == amount
+    )
+
+
+def test_bulk_delete_income_after_rollover(
+    client, session, user, income, token, admin_headers
+):
+    income_id = income.id
+    client.post(
+        "/months/",
+        headers=admin_headers,
+        json={"created_at": "2024-12-01T00:00:01"},
+    )
+
+    response = client.request(
+        "DELETE",
+        "/incomes/bulk",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"ids": [income_id]},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["deleted"] == [income_id]
+    assert session.scalar(select(func.count()).select_from(MonthIncome)) == 1
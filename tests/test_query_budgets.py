@@ -0,0 +1,156 @@
+from http import HTTPStatus
+
+import pytest
+
+from app.models.essential_expense import EssentialExpense
+from app.models.income import Income
+from app.models.non_essential_expense import NonEssentialExpense
+
+LINES = 20
+
+LEDGERS = {
+    "incomes": (Income, "/incomes", "amount"),
+    "essential": (EssentialExpense, "/essential-expenses", "expected"),
+    "non-essential": (
+        NonEssentialExpense,
+        "/non-essential-expenses",
+        "expected",
+    ),
+}
+
+
+@pytest.fixture(params=list(LEDGERS.values()), ids=list(LEDGERS))
+def ledger(request):
+    return request.param
+
+
+@pytest.fixture
+def headers(client, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    # Cache the user, so the budgets only count the routes' own queries.
+    client.post("/auth/refresh_token", headers=headers)
+
+    return headers
+
+
+@pytest.fixture
+def lines(ledger, session, user, member):
+    model, _, value = ledger
+    items = [
+        model(
+            **{
+                "name": f"Line {index}",
+                value: 100,
+                "id_user_fk": user.id,
+                "id_member_fk": member.id,
+                "member": member,
+            }
+        )
+        for index in range(LINES)
+    ]
+    session.add_all(items)
+    session.commit()
+
+    return [item.id for item in items]
+
+
+def test_ledger_list_budgets(
+    client, headers, ledger, lines, assert_max_queries
+):
+    _, prefix, _ = ledger
+
+    # Data version, count and page; the members come with the page.
+    with assert_max_queries(3, rows=LINES + 2):
+        response = client.get(f"{prefix}/?per_page={LINES}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["items"]) == LINES
+
+    with assert_max_queries(2, rows=LINES + 1):
+        response = client.get(
+            f"{prefix}/?per_page={LINES}&cursor=", headers=headers
+        )
+
+    assert response.status_code == HTTPStatus.OK
+
+    with assert_max_queries(2, rows=2):
+        response = client.get(f"{prefix}/{lines[0]}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_ledger_write_budgets(
+    client, headers, member, ledger, lines, assert_max_queries
+):
+    _, prefix, value = ledger
+    body = {"name": "test", value: 1.0, "id_member_fk": member.id}
+
+    with assert_max_queries(1):
+        response = client.post(f"{prefix}/", headers=headers, json=body)
+
+    assert response.status_code == HTTPStatus.CREATED
+
+    with assert_max_queries(1):
+        response = client.put(
+            f"{prefix}/{lines[0]}", headers=headers, json=body
+        )
+
+    assert response.status_code == HTTPStatus.OK
+
+    with assert_max_queries(1):
+        response = client.delete(f"{prefix}/{lines[0]}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_member_list_budgets(client, headers, member, assert_max_queries):
+    with assert_max_queries(1):
+        response = client.get("/members/", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+
+    # Data version and the user's members.
+    with assert_max_queries(2, rows=2):
+        response = client.get("/members/list", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["members"]) == 1
+
+
+def test_member_write_budgets(client, headers, member, assert_max_queries):
+    # The write, the data version bump and the refresh.
+    with assert_max_queries(3):
+        response = client.post(
+            "/members/", headers=headers, json={"name": "test"}
+        )
+
+    assert response.status_code == HTTPStatus.CREATED
+
+    # Plus the ownership check.
+    with assert_max_queries(4):
+        response = client.put(
+            f"/members/{member.id}", headers=headers, json={"name": "test"}
+        )
+
+    assert response.status_code == HTTPStatus.OK
+
+    # Plus the months whose rollups name the member.
+    with assert_max_queries(4):
+        response = client.delete(f"/members/{member.id}", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_user_route_budgets(client, headers, user, assert_max_queries):
+    with assert_max_queries(1):
+        response = client.get("/users/", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+
+    # The cached user is merged without a load: the update and refresh.
+    with assert_max_queries(2):
+        response = client.patch(
+            f"/users/{user.id}", headers=headers, json={"name": "test"}
+        )
+
+    assert response.status_code == HTTPStatus.OK
@@ -0,0 +1,148 @@
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models.essential_expense import EssentialExpense
+from app.models.month_essential_expense import MonthEssentialExpense
+from app.models.monthly_rollup import MonthlyRollup
+from app.modules.report.rollup import refresh_rollup
+
+
+@pytest.fixture
+def create_month(client, admin_headers):
+    def create(created_at):
+        response = client.post(
+            "/months/", headers=admin_headers, json={"created_at": created_at}
+        )
+
+        return response.json()["id"]
+
+    return create
+
+
+def test_read_yearly_report(client, user, income, token, create_month):
+    create_month("2023-12-01T00:00:00")
+    create_month("2024-01-01T00:00:00")
+    create_month("2024-02-01T00:00:00")
+
+    response = client.get(
+        "/reports/yearly", headers={"Authorization": f"Bearer {token}"}
+    )
+
+    amount = float(income.amount)
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "years": [
+            {
+                "year": year,
+                "income": amount * months,
+                "essential_expected": 0.0,
+                "essential_paid": 0.0,
+                "non_essential_expected": 0.0,
+                "non_essential_paid": 0.0,
+                "balance": amount * months,
+            }
+            for year, months in ((2023, 1), (2024, 2))
+        ]
+    }
+
+
+def test_read_yearly_report_filters_years(
+    client, user, income, token, create_month
+):
+    create_month("2023-12-01T00:00:00")
+    create_month("2024-01-01T00:00:00")
+
+    response = client.get(
+        "/reports/yearly?from_year=2024",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert [year["year"] for year in response.json()["years"]] == [2024]
+
+
+def test_refresh_rollup_only_touches_the_range(
+    client, session, user, other_user, create_month
+):
+    session.add_all(
+        [
+            EssentialExpense(
+                id_user_fk=owner.id,
+                id_member_fk=None,
+                name="Rent",
+                expected=100,
+                member=None,
+            )
+            for owner in (user, other_user)
+        ]
+    )
+    session.commit()
+    month_id = create_month("2024-01-01T00:00:00")
+    session.execute(
+        update(MonthEssentialExpense)
+        .where(MonthEssentialExpense.id_month_fk == month_id)
+        .values(paid=60)
+    )
+
+    refresh_rollup(
+        session, month_id, after_user_id=user.id - 1, up_to_user_id=user.id
+    )
+    session.commit()
+
+    paid = dict(
+        session.execute(
+            select(MonthlyRollup.id_user_fk, MonthlyRollup.paid).where(
+                MonthlyRollup.id_month_fk == month_id
+            )
+        ).all()
+    )
+    assert paid == {user.id: 60, other_user.id: 0}
+
+
+def test_yearly_report_agrees_with_month_summary_after_edits(
+    client, session, user, member, income, token, create_month
+):
+    headers = {"Authorization": f"Bearer {token}"}
+    expense = EssentialExpense(
+        id_user_fk=user.id,
+        id_member_fk=member.id,
+        name="Rent",
+        expected=100,
+        member=member,
+    )
+    session.add(expense)
+    session.commit()
+    income_id, expense_id, member_id = income.id, expense.id, member.id
+    month_id = create_month("2024-01-01T00:00:00")
+
+    for response in (
+        client.put(
+            f"/incomes/{income_id}",
+            headers=headers,
+            json={"name": "Raise", "amount": 5000, "id_member_fk": member_id},
+        ),
+        client.delete(f"/essential-expenses/{expense_id}", headers=headers),
+        client.delete(f"/members/{member_id}", headers=headers),
+    ):
+        assert response.status_code == HTTPStatus.OK
+
+    summary = client.get(f"/months/{month_id}/summary", headers=headers)
+    report = client.get("/reports/yearly", headers=headers)
+
+    (year,) = report.json()["years"]
+    assert year == {
+        "year": 2024,
+        **{
+            name: value
+            for name, value in summary.json().items()
+            if name not in {"id_month_fk", "members"}
+        },
+    }
+    assert year["essential_expected"] == 100.0
+    assert summary.json()["members"][0]["member"] is None
+    assert session.scalars(
+        select(MonthlyRollup.id_member_fk).where(
+            MonthlyRollup.id_user_fk == user.id
+        )
+    ).all() == [None, None]
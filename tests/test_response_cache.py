@@ -0,0 +1,68 @@
+from http import HTTPStatus
+
+import pytest
+
+from app.database import settings
+from app.shared.response_cache import response_cache
+
+
+@pytest.fixture
+def enable_response_cache(monkeypatch):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+
+
+def _get(client, url, token):
+    return client.get(url, headers={"Authorization": f"Bearer {token}"})
+
+
+def test_list_is_served_from_the_cache(
+    client, income, token, enable_response_cache
+):
+    first = _get(client, "/incomes/", token)
+    second = _get(client, "/incomes/", token)
+
+    assert second.status_code == HTTPStatus.OK
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["content-type"] == "application/json"
+    assert response_cache.stats()["hits"] == 1
+
+
+def test_write_makes_the_cached_list_stale(
+    client, member, income, token, enable_response_cache
+):
+    _get(client, "/incomes/", token)
+
+    client.put(
+        f"/incomes/{income.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "New", "amount": 1.0, "id_member_fk": member.id},
+    )
+    response = _get(client, "/incomes/", token)
+
+    assert response.json()["items"][0]["name"] == "New"
+    assert response_cache.stats()["hits"] == 0
+
+
+def test_cache_is_keyed_by_query(client, member, token, enable_response_cache):
+    _get(client, "/members/list", token)
+    response = _get(client, "/members/list?unused=1", token)
+
+    assert response.json() == {
+        "members": [{"id": member.id, "name": member.name}]
+    }
+    assert response_cache.stats()["size"] == 2
+
+
+def test_cache_is_off_by_default(client, income, token):
+    _get(client, "/incomes/", token)
+    _get(client, "/incomes/", token)
+
+    assert response_cache.stats()["size"] == 0
+
+
+def test_read_response_cache_stats(client):
+    response = client.get("/metrics/response-cache")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["max_bytes"] == settings.RESPONSE_CACHE_MAX_BYTES
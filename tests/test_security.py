@@ -1,8 +1,18 @@
+from datetime import datetime, timedelta
 from http import HTTPStatus
 
+from freezegun import freeze_time
 from jwt import decode
+from sqlalchemy import update
 
-from app.security import create_access_token, settings
+from app.models.user import User
+from app.security import (
+    create_access_token,
+    revoke_tokens,
+    settings,
+    token_versions,
+    user_cache,
+)
 
 
 def test_jwt():
@@ -50,3 +60,122 @@ def test_get_current_user_does_not_exists__exercicio(client):
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
     assert response.json() == {"detail": "Could not validate credentials"}
+
+
+def test_get_current_user_is_cached(client, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.post("/auth/refresh_token", headers=headers)
+    response = client.post("/auth/refresh_token", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert user_cache.stats()["hits"] == 1
+
+
+def test_tokens_of_one_user_are_cached_apart(client, user, token):
+    with freeze_time(datetime.now() - timedelta(minutes=1)):
+        other_token = create_access_token(
+            data={"sub": user.username}, user=user
+        )
+
+    for headers in (
+        {"Authorization": f"Bearer {token}"},
+        {"Authorization": f"Bearer {other_token}"},
+    ) * 2:
+        response = client.post("/auth/refresh_token", headers=headers)
+        assert response.status_code == HTTPStatus.OK
+
+    assert user_cache.stats()["hits"] == 2
+    assert user_cache.stats()["size"] == 2
+
+
+def test_update_user_invalidates_cached_user(client, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    client.post("/auth/refresh_token", headers=headers)
+
+    response = client.put(
+        f"/users/{user.id}",
+        headers=headers,
+        json={
+            "name": "test",
+            "username": "renamed",
+            "email": "test@example.com",
+            "password": "mynewpassword",
+        },
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.post("/auth/refresh_token", headers=headers)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_login_token_carries_user_claims(token, user):
+    decoded = decode(
+        token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    )
+
+    assert decoded["uid"] == user.id
+    assert decoded["ver"] == 0
+
+
+def test_token_user_skips_the_user_row(
+    client, user, token, assert_max_queries
+):
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get("/members/list", headers=headers)
+
+    with assert_max_queries(2) as executed:
+        response = client.get("/members/list", headers=headers)
+
+    assert response.status_code == HTTPStatus.OK
+    assert not any('FROM "user"' in statement for statement in executed)
+    assert user_cache.stats()["misses"] == 0
+    assert token_versions.get(user.id) == 0
+
+
+def test_password_change_revokes_tokens(client, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+    client.get("/members/list", headers=headers)
+
+    response = client.patch(
+        f"/users/{user.id}", headers=headers, json={"password": "changed"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert (
+        client.get("/members/list", headers=headers).status_code
+        == HTTPStatus.UNAUTHORIZED
+    )
+    assert (
+        client.post("/auth/refresh_token", headers=headers).status_code
+        == HTTPStatus.UNAUTHORIZED
+    )
+
+
+def test_revoke_tokens_counts_concurrent_revocations(session, user):
+    version = user.token_version
+    token_versions.set(user.id, version)
+    # Another request revokes the user's tokens behind this session.
+    session.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(token_version=User.token_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+    revoke_tokens(user)
+    session.commit()
+    session.refresh(user)
+
+    assert user.token_version == version + 2
+    assert token_versions.get(user.id) is None
+
+
+def test_deleted_user_token_is_rejected(client, user, token):
+    headers = {"Authorization": f"Bearer {token}"}
+
+    client.delete(f"/users/{user.id}", headers=headers)
+    response = client.get("/members/list", headers=headers)
+
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -76,3 +76,52 @@ def test_delete_user_not_permissions(client, other_user, token):
 
     assert response.status_code == HTTPStatus.FORBIDDEN
     assert response.json() == {"detail": "Not enough permissions"}
+
+
+def test_partial_update_user_keeps_password_hash(client, session, user, token):
+    password_hash = user.password
+
+    response = client.patch(
+        f"/users/{user.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "new name"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "id": user.id,
+        "name": "new name",
+        "username": user.username,
+        "email": user.email,
+    }
+
+    session.refresh(user)
+    assert user.password == password_hash
+
+
+def test_partial_update_user_password(client, user, token):
+    response = client.patch(
+        f"/users/{user.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"password": "mynewpassword"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.post(
+        "/auth/token",
+        data={"username": user.username, "password": "mynewpassword"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_partial_update_user_not_permissions(client, other_user, token):
+    response = client.patch(
+        f"/users/{other_user.id}",
+        headers={"Authorization": f"Bearer {token}"},
+        json={"name": "new name"},
+    )
+
+    assert response.status_code == HTTPStatus.FORBIDDEN
+    assert response.json() == {"detail": "Not enough permissions"}